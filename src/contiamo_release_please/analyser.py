@@ -1,6 +1,8 @@
 """Commit message analysis for determining release types."""
 
+import functools
 import re
+from collections import Counter
 from typing import TypedDict
 
 from contiamo_release_please.config import ReleaseConfig
@@ -17,6 +19,9 @@ class ParsedCommit(TypedDict):
 
 # Release type priority (higher index = higher priority)
 RELEASE_TYPE_PRIORITY = ["patch", "minor", "major"]
+_RELEASE_TYPE_PRIORITY_INDEX = {
+    release_type: index for index, release_type in enumerate(RELEASE_TYPE_PRIORITY)
+}
 
 # Release commit patterns that identify release infrastructure commits
 # These patterns use {release_branch} as a placeholder for dynamic substitution
@@ -35,43 +40,183 @@ RELEASE_COMMIT_PATTERNS = [
     r"^(Merged PR \d+: )?chore\([^)]+\):\s+(update files for )?release",
 ]
 
+# Breaking change footer in the commit body ("BREAKING CHANGE:" or "BREAKING-CHANGE:")
+_BREAKING_CHANGE_RE = re.compile(r"BREAKING[- ]CHANGE:", re.IGNORECASE)
 
-def parse_commit_message(message: str) -> ParsedCommit:
-    """Parse a conventional commit message.
+# Any mention of "breaking" (footer or a literal "breaking" commit type)
+_BREAKING_WORD_RE = re.compile(r"breaking", re.IGNORECASE)
+
+# Azure DevOps merge commit prefix (e.g. "Merged PR 527516: ")
+_AZURE_MERGE_PREFIX_RE = re.compile(r"^Merged PR \d+:\s*")
+
+# Conventional commit format: type(scope)!: description
+_CONVENTIONAL_COMMIT_RE = re.compile(
+    r"^(?P<type>\w+)(?:\((?P<scope>[^)]+)\))?(?P<breaking>!)?\s*:\s*(?P<description>.+)$"
+)
+
+# Commit types accepted in pull request titles
+PR_TITLE_TYPES = (
+    "feat",
+    "fix",
+    "chore",
+    "ci",
+    "docs",
+    "refactor",
+    "test",
+    "perf",
+    "style",
+    "build",
+)
+
+# Pull request title format: type(scope)!: description
+_PR_TITLE_RE = re.compile(rf"^({'|'.join(PR_TITLE_TYPES)})(\(.+\))?!?:\s+.+")
+
+
+# Compiled release commit regexes, keyed by release branch name
+_RELEASE_REGEX_CACHE: dict[str, re.Pattern[str]] = {}
+
+
+def _release_regex(release_branch_name: str) -> re.Pattern[str]:
+    """Compile the release commit patterns for a given release branch.
+
+    The patterns are combined into a single alternation so a commit message
+    is scanned once rather than once per pattern. Compiled patterns are kept
+    in a plain dict, which is cheaper to hit than an lru_cache wrapper when
+    the same branch is checked for every commit.
+
+    Args:
+        release_branch_name: Name of the release branch
+
+    Returns:
+        Compiled pattern matching any release commit for the branch
+    """
+    pattern = _RELEASE_REGEX_CACHE.get(release_branch_name)
+    if pattern is None:
+        pattern = re.compile(
+            "|".join(
+                f"(?:{template.replace('{release_branch}', release_branch_name)})"
+                for template in RELEASE_COMMIT_PATTERNS
+            )
+        )
+        _RELEASE_REGEX_CACHE[release_branch_name] = pattern
+    return pattern
+
+
+def _parse_conventional_header(message: str) -> tuple[str, str, bool, str] | None:
+    """Parse a conventional commit header using string operations only.
+
+    Only handles messages whose shape is unambiguous; anything else returns
+    None so the caller can fall back to the full regex.
+
+    Args:
+        message: Stripped commit message without an Azure DevOps merge prefix
+
+    Returns:
+        Tuple of (type, scope, breaking, description), or None if the message
+        needs the regex parser
+    """
+    colon = message.find(":")
+    if colon <= 0 or "\n" in message:
+        return None
+
+    description = message[colon + 1 :].lstrip()
+    if not description:
+        return None
+
+    header = message[:colon].rstrip()
+    breaking = header.endswith("!")
+    if breaking:
+        header = header[:-1]
+
+    scope = ""
+    if header.endswith(")"):
+        open_paren = header.find("(")
+        if open_paren <= 0:
+            return None
+        scope = header[open_paren + 1 : -1]
+        if not scope or ")" in scope:
+            return None
+        header = header[:open_paren]
+
+    if not header.replace("_", "").isalnum():
+        return None
+
+    return header, scope, breaking, description
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_commit_fields(message: str) -> tuple[str, str, bool, str]:
+    """Parse a conventional commit message into an immutable tuple.
+
+    Cached so that repeated messages (and repeated passes over the same
+    commit list) are only parsed once.
 
     Args:
         message: Commit message string
 
     Returns:
-        Dictionary with 'type', 'scope', 'breaking', and 'description' keys
+        Tuple of (type, scope, breaking, description)
     """
     # Strip Azure DevOps merge commit prefix if present
     # Example: "Merged PR 527516: ci: add release process" -> "ci: add release process"
-    message = re.sub(r"^Merged PR \d+:\s*", "", message.strip())
+    message = message.strip()
+    if message.startswith("Merged PR "):
+        message = _AZURE_MERGE_PREFIX_RE.sub("", message)
+
+    # Fast path for the common single-line "type(scope)!: description" form
+    fields = _parse_conventional_header(message)
+    if fields is not None:
+        return fields
 
     # Conventional commit format: type(scope)!: description
     # Breaking change indicators: ! after type/scope, or "BREAKING CHANGE:" in body
-    pattern = r"^(?P<type>\w+)(?:\((?P<scope>[^)]+)\))?(?P<breaking>!)?\s*:\s*(?P<description>.+)$"
-
-    match = re.match(pattern, message)
+    match = _CONVENTIONAL_COMMIT_RE.match(message)
 
     if match:
-        return {
-            "type": match.group("type"),
-            "scope": match.group("scope") or "",
-            "breaking": match.group("breaking") == "!",
-            "description": match.group("description"),
-        }
+        return (
+            match.group("type"),
+            match.group("scope") or "",
+            match.group("breaking") == "!",
+            match.group("description"),
+        )
 
     # If doesn't match conventional commit format, return unknown type
+    return "unknown", "", False, message.strip()
+
+
+def parse_commit_message(message: str) -> ParsedCommit:
+    """Parse a conventional commit message.
+
+    Args:
+        message: Commit message string
+
+    Returns:
+        Dictionary with 'type', 'scope', 'breaking', and 'description' keys
+    """
+    commit_type, scope, breaking, description = _parse_commit_fields(message)
+
+    # Build a fresh dict each time so callers can't mutate the cached result
     return {
-        "type": "unknown",
-        "scope": "",
-        "breaking": False,
-        "description": message.strip(),
+        "type": commit_type,
+        "scope": scope,
+        "breaking": breaking,
+        "description": description,
     }
 
 
+@functools.lru_cache(maxsize=4096)
+def _has_breaking_change_footer(message: str) -> bool:
+    """Check if a commit message contains a BREAKING CHANGE footer.
+
+    Args:
+        message: Full commit message (may include body)
+
+    Returns:
+        True if the message contains a breaking change footer
+    """
+    return _BREAKING_CHANGE_RE.search(message) is not None
+
+
 def check_breaking_change(message: str, parsed: ParsedCommit) -> bool:
     """Check if commit message indicates a breaking change.
 
@@ -87,29 +232,61 @@ def check_breaking_change(message: str, parsed: ParsedCommit) -> bool:
         return True
 
     # Check for BREAKING CHANGE: in commit body
-    if "BREAKING CHANGE:" in message.upper() or "BREAKING-CHANGE:" in message.upper():
+    if _has_breaking_change_footer(message):
         return True
 
     return False
 
 
-def analyse_commits(commit_messages: list[str], config: ReleaseConfig) -> str | None:
-    """Analyse commit messages and determine the release type.
+def _analyse(
+    commit_messages: list[str], config: ReleaseConfig, summarise: bool
+) -> tuple[str | None, dict[str, int]]:
+    """Determine the release type and commit type summary in a single pass.
 
     Args:
         commit_messages: List of commit message strings
         config: Release configuration
+        summarise: If False, skip building the summary and stop scanning as
+            soon as the release type can no longer change
 
     Returns:
-        Release type ('major', 'minor', 'patch') or None if no relevant commits
+        Tuple of (release type or None, commit type counts sorted by type)
     """
-    if not commit_messages:
-        return None
-
+    summary: dict[str, int] = {}
     highest_release_type = None
     highest_priority = -1
+    minor_priority = _RELEASE_TYPE_PRIORITY_INDEX["minor"]
+    major_priority = _RELEASE_TYPE_PRIORITY_INDEX["major"]
+
+    # Commit types that trigger a major release. Once a minor release has been
+    # found only these can change the outcome, so other commits can be skipped.
+    # Only needed when stopping early; the summary path must see every commit.
+    major_prefixes = (
+        set()
+        if summarise
+        else {
+            prefix
+            for prefix in config.get_all_valid_prefixes()
+            if config.get_release_type_for_prefix(prefix) == "major"
+        }
+    )
+    major_only_breaking = major_prefixes <= {"breaking"}
+
+    # Identical messages (e.g. cherry-picks, merge duplicates) classify the
+    # same way, so analyse each distinct message once and weight by count
+    for message, count in Counter(commit_messages).items():
+        if not summarise and highest_priority == minor_priority:
+            if not major_prefixes:
+                # Nothing can outrank a minor release
+                break
+            if (
+                major_only_breaking
+                and "!" not in message
+                and _BREAKING_WORD_RE.search(message) is None
+            ):
+                # Cannot be a breaking change, so cannot be a major release
+                continue
 
-    for message in commit_messages:
         parsed = parse_commit_message(message)
         commit_type = parsed["type"]
 
@@ -117,21 +294,64 @@ def analyse_commits(commit_messages: list[str], config: ReleaseConfig) -> str |
         if check_breaking_change(message, parsed):
             commit_type = "breaking"
 
+        if summarise:
+            summary[commit_type] = summary.get(commit_type, 0) + count
+
+        if highest_priority == major_priority:
+            # Release type is settled; only the summary still needs counting
+            continue
+
         # Get release type for this commit type
         release_type = config.get_release_type_for_prefix(commit_type)
 
         if release_type:
             # Check if this release type has higher priority
-            priority = RELEASE_TYPE_PRIORITY.index(release_type)
+            priority = _RELEASE_TYPE_PRIORITY_INDEX[release_type]
             if priority > highest_priority:
                 highest_priority = priority
                 highest_release_type = release_type
 
             # Early exit if we found a major release (highest priority)
-            if release_type == "major":
+            if release_type == "major" and not summarise:
                 break
 
-    return highest_release_type
+    return highest_release_type, dict(sorted(summary.items()))
+
+
+def analyse(
+    commit_messages: list[str], config: ReleaseConfig
+) -> tuple[str | None, dict[str, int]]:
+    """Analyse commit messages for both the release type and a type summary.
+
+    Equivalent to calling analyse_commits() and get_commit_type_summary(),
+    but walks and parses the commit list only once.
+
+    Args:
+        commit_messages: List of commit message strings
+        config: Release configuration
+
+    Returns:
+        Tuple of (release type or None, dictionary mapping commit types to
+        counts, sorted by commit type)
+    """
+    return _analyse(commit_messages, config, summarise=True)
+
+
+def analyse_commits(commit_messages: list[str], config: ReleaseConfig) -> str | None:
+    """Analyse commit messages and determine the release type.
+
+    Args:
+        commit_messages: List of commit message strings
+        config: Release configuration
+
+    Returns:
+        Release type ('major', 'minor', 'patch') or None if no relevant commits
+    """
+    if not commit_messages:
+        return None
+
+    release_type, _ = _analyse(commit_messages, config, summarise=False)
+    return release_type
 
 
 def get_commit_type_summary(
@@ -144,11 +364,11 @@ def get_commit_type_summary(
         config: Release configuration
 
     Returns:
-        Dictionary mapping commit types to counts
+        Dictionary mapping commit types to counts, sorted by commit type
     """
     summary: dict[str, int] = {}
 
-    for message in commit_messages:
+    for message, count in Counter(commit_messages).items():
         parsed = parse_commit_message(message)
         commit_type = parsed["type"]
 
@@ -156,9 +376,9 @@ def get_commit_type_summary(
         if check_breaking_change(message, parsed):
             commit_type = "breaking"
 
-        summary[commit_type] = summary.get(commit_type, 0) + 1
+        summary[commit_type] = summary.get(commit_type, 0) + count
 
-    return summary
+    return dict(sorted(summary.items()))
 
 
 def is_release_commit(commit_message: str, release_branch_name: str) -> bool:
@@ -174,11 +394,24 @@ def is_release_commit(commit_message: str, release_branch_name: str) -> bool:
     Returns:
         True if this is a release infrastructure commit, False otherwise
     """
-    for pattern in RELEASE_COMMIT_PATTERNS:
-        # Substitute the release branch name into the pattern
-        resolved_pattern = pattern.replace("{release_branch}", release_branch_name)
+    # Cheap prefilter: every pattern requires either a "Merge " substring or a
+    # leading "chore(" / "Merged PR " prefix, so most commits skip the regex
+    if "Merge " not in commit_message and not commit_message.startswith(
+        ("chore(", "Merged PR ")
+    ):
+        return False
 
-        if re.search(resolved_pattern, commit_message):
-            return True
+    return _release_regex(release_branch_name).search(commit_message) is not None
 
-    return False
+
+def is_valid_pr_title(title: str) -> bool:
+    """Check if a pull request title follows the conventional commit format.
+
+    Args:
+        title: Pull request title (e.g., 'feat(api): add endpoint')
+
+    Returns:
+        True if the title starts with an allowed type, optional scope and
+        breaking marker, then a colon and description; False otherwise
+    """
+    return _PR_TITLE_RE.match(title) is not None
@@ -3,17 +3,116 @@
 import json
 import os
 import re
-import subprocess
 from pathlib import Path
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from contiamo_release_please.git import GitError, get_remote_url
 
 
 class AzureDevOpsError(Exception):
     """Raised when Azure DevOps API operations fail."""
 
 
+class PullRequestExistsError(AzureDevOpsError):
+    """Raised when an active PR already exists for the source and target branch."""
+
+
+# Azure DevOps error code for "an active pull request already exists"
+_PR_EXISTS_ERROR_CODE = "TF401179"
+
+
+# Remote URL formats, in order of how commonly they are used:
+# - https://dev.azure.com/org/project/_git/repo
+# - https://org@dev.azure.com/org/project/_git/repo
+# - git@ssh.dev.azure.com:v3/org/project/repo
+# - https://org.visualstudio.com/project/_git/repo
+_HTTPS_REMOTE_RE = re.compile(
+    r"https://(?:[^@]+@)?dev\.azure\.com/([^/]+)/([^/]+)/_git/(.+?)(?:\.git)?$"
+)
+_SSH_REMOTE_RE = re.compile(
+    r"git@ssh\.dev\.azure\.com:v3/([^/]+)/([^/]+)/(.+?)(?:\.git)?$"
+)
+_VISUALSTUDIO_REMOTE_RE = re.compile(
+    r"https://([^.]+)\.visualstudio\.com/([^/]+)/_git/(.+?)(?:\.git)?$"
+)
+_REMOTE_URL_PATTERNS = (_HTTPS_REMOTE_RE, _SSH_REMOTE_RE, _VISUALSTUDIO_REMOTE_RE)
+
+_session: requests.Session | None = None
+
+
+def _get_session() -> requests.Session:
+    """Get the shared HTTP session for Azure DevOps API calls.
+
+    Reusing one session keeps the connection to dev.azure.com alive across
+    the find/create/update calls of a release. Transient gateway errors are
+    retried for idempotent methods only, so PR creation is never repeated.
+
+    Returns:
+        Shared requests session
+    """
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        retry = Retry(
+            total=3,
+            status_forcelist=(502, 503, 504),
+            backoff_factor=0.3,
+        )
+        _session.mount("https://", HTTPAdapter(max_retries=retry))
+    return _session
+
+
+def _read_json(response: requests.Response) -> Any:
+    """Check a response for errors and decode its JSON body.
+
+    Decodes the raw body directly, skipping the charset detection that
+    Response.json() performs.
+
+    Args:
+        response: Response from the Azure DevOps API
+
+    Returns:
+        Decoded JSON body
+
+    Raises:
+        requests.exceptions.HTTPError: If the response has an error status
+        requests.exceptions.InvalidJSONError: If the body is not valid JSON
+    """
+    if not response.ok:
+        response.raise_for_status()
+    try:
+        return json.loads(response.content)
+    except ValueError as e:
+        raise requests.exceptions.InvalidJSONError(
+            f"Invalid JSON in response: {e}", response=response
+        )
+
+
+def _error_message(error_msg: str, error: requests.exceptions.RequestException) -> str:
+    """Append the Azure DevOps error message from a failed response, if any.
+
+    Args:
+        error_msg: Base error message
+        error: Exception raised by requests
+
+    Returns:
+        Error message, including the API's message when one is available
+    """
+    response = error.response
+    if response is not None:
+        try:
+            error_data = json.loads(response.content)
+            if "message" in error_data:
+                error_msg += f" - {error_data['message']}"
+        except Exception:
+            pass
+    return error_msg
+
+
 def get_azure_token(config: dict[str, Any]) -> str:
     """Get Azure DevOps token from environment or config.
 
@@ -57,49 +156,18 @@ def get_azure_repo_info(git_root: Path) -> tuple[str, str, str]:
         AzureDevOpsError: If remote URL cannot be parsed
     """
     try:
-        result = subprocess.run(
-            ["git", "remote", "get-url", "origin"],
-            cwd=git_root,
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        remote_url = result.stdout.strip()
-
-        # Parse different URL formats:
-        # - https://dev.azure.com/org/project/_git/repo
-        # - https://org@dev.azure.com/org/project/_git/repo
-        # - git@ssh.dev.azure.com:v3/org/project/repo
-        # - https://org.visualstudio.com/project/_git/repo
-
-        # New Azure DevOps format (dev.azure.com)
-        https_match = re.match(
-            r"https://(?:[^@]+@)?dev\.azure\.com/([^/]+)/([^/]+)/_git/(.+?)(?:\.git)?$",
-            remote_url,
-        )
-        if https_match:
-            return https_match.group(1), https_match.group(2), https_match.group(3)
-
-        # SSH format
-        ssh_match = re.match(
-            r"git@ssh\.dev\.azure\.com:v3/([^/]+)/([^/]+)/(.+?)(?:\.git)?$", remote_url
-        )
-        if ssh_match:
-            return ssh_match.group(1), ssh_match.group(2), ssh_match.group(3)
+        remote_url = get_remote_url(git_root)
 
-        # Old visualstudio.com format
-        vs_match = re.match(
-            r"https://([^.]+)\.visualstudio\.com/([^/]+)/_git/(.+?)(?:\.git)?$",
-            remote_url,
-        )
-        if vs_match:
-            return vs_match.group(1), vs_match.group(2), vs_match.group(3)
+        for pattern in _REMOTE_URL_PATTERNS:
+            match = pattern.match(remote_url)
+            if match:
+                return match.group(1), match.group(2), match.group(3)
 
         raise AzureDevOpsError(
             f"Could not parse Azure DevOps org/project/repo from remote URL: {remote_url}"
         )
 
-    except subprocess.CalledProcessError as e:
+    except GitError as e:
         raise AzureDevOpsError(f"Failed to get git remote URL: {e}")
 
 
@@ -135,21 +203,20 @@ def find_existing_pr(
         "searchCriteria.status": "active",
         "searchCriteria.sourceRefName": f"refs/heads/{source_branch}",
         "searchCriteria.targetRefName": f"refs/heads/{target_branch}",
+        "$top": 1,  # Only the first match is used
         "api-version": "7.1",
     }
 
     try:
-        response = requests.get(
+        response = _get_session().get(
             url,
             auth=("", token),  # Empty username, PAT as password
             headers=headers,
             params=params,
             timeout=30,
         )
-        response.raise_for_status()
-
-        prs = response.json().get("value", [])
-        if prs and len(prs) > 0:
+        prs = _read_json(response).get("value", [])
+        if prs:
             return prs[0]["pullRequestId"]
 
         return None
@@ -184,6 +251,7 @@ def create_pull_request(
         PR data from Azure DevOps API
 
     Raises:
+        PullRequestExistsError: If an active PR for the branches already exists
         AzureDevOpsError: If PR creation fails
     """
     url = f"https://dev.azure.com/{org}/{project}/_apis/git/repositories/{repo}/pullrequests"
@@ -201,26 +269,22 @@ def create_pull_request(
     }
 
     try:
-        response = requests.post(
+        response = _get_session().post(
             url,
             auth=("", token),  # Empty username, PAT as password
             headers=headers,
             params=params,
-            data=json.dumps(payload),
+            data=json.dumps(payload, separators=(",", ":")),
             timeout=30,
         )
-        response.raise_for_status()
-        return response.json()
+        return _read_json(response)
 
     except requests.exceptions.RequestException as e:
-        error_msg = f"Failed to create pull request: {e}"
-        if hasattr(e, "response") and e.response is not None:
-            try:
-                error_data = e.response.json()
-                if "message" in error_data:
-                    error_msg += f" - {error_data['message']}"
-            except Exception:
-                pass
+        error_msg = _error_message(f"Failed to create pull request: {e}", e)
+        if e.response is not None and (
+            e.response.status_code == 409 or _PR_EXISTS_ERROR_CODE in error_msg
+        ):
+            raise PullRequestExistsError(error_msg)
         raise AzureDevOpsError(error_msg)
 
 
@@ -263,27 +327,18 @@ def update_pull_request(
     }
 
     try:
-        response = requests.patch(
+        response = _get_session().patch(
             url,
             auth=("", token),  # Empty username, PAT as password
             headers=headers,
             params=params,
-            data=json.dumps(payload),
+            data=json.dumps(payload, separators=(",", ":")),
             timeout=30,
         )
-        response.raise_for_status()
-        return response.json()
+        return _read_json(response)
 
     except requests.exceptions.RequestException as e:
-        error_msg = f"Failed to update pull request: {e}"
-        if hasattr(e, "response") and e.response is not None:
-            try:
-                error_data = e.response.json()
-                if "message" in error_data:
-                    error_msg += f" - {error_data['message']}"
-            except Exception:
-                pass
-        raise AzureDevOpsError(error_msg)
+        raise AzureDevOpsError(_error_message(f"Failed to update pull request: {e}", e))
 
 
 def create_or_update_pr(
@@ -321,16 +376,22 @@ def create_or_update_pr(
     if dry_run:
         return None
 
-    # Check if PR already exists
-    existing_pr = find_existing_pr(org, project, repo, head_branch, base_branch, token)
-
-    if existing_pr:
-        if verbose:
-            print(f"Updating existing PR #{existing_pr}")
-        return update_pull_request(org, project, repo, existing_pr, title, body, token)
-    else:
-        if verbose:
-            print(f"Creating new PR from {head_branch} to {base_branch}")
-        return create_pull_request(
+    # Most releases open a new PR, so try creating it first and only look up
+    # the existing PR when Azure DevOps reports a conflict
+    try:
+        pr_data = create_pull_request(
             org, project, repo, title, body, head_branch, base_branch, token
         )
+        if verbose:
+            print(f"Created new PR from {head_branch} to {base_branch}")
+        return pr_data
+    except PullRequestExistsError:
+        existing_pr = find_existing_pr(
+            org, project, repo, head_branch, base_branch, token
+        )
+        if not existing_pr:
+            raise
+
+    if verbose:
+        print(f"Updating existing PR #{existing_pr}")
+    return update_pull_request(org, project, repo, existing_pr, title, body, token)
@@ -1,5 +1,7 @@
 """Bootstrap CI/CD workflows for Contiamo Release Please."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Literal
 
@@ -16,6 +18,28 @@ from contiamo_release_please.ci_templates import (
 
 Flavour = Literal["github", "azure", "gitlab"]
 
+# Templates normalised once to the exact file contents written to disk
+_GITHUB_WORKFLOW = GITHUB_WORKFLOW_TEMPLATE.strip() + "\n"
+_AZURE_CI = AZURE_CI_TEMPLATE.strip() + "\n"
+_AZURE_PR_VALIDATION = AZURE_PR_VALIDATION_TEMPLATE.strip() + "\n"
+_AZURE_PR_VALIDATION_SCRIPT = AZURE_PR_VALIDATION_SCRIPT.strip() + "\n"
+_AZURE_BRANCH_POLICIES_README = AZURE_BRANCH_POLICIES_README.strip() + "\n"
+_AZURE_CI_SETUP_README = AZURE_CI_SETUP_README.strip() + "\n"
+_GITLAB_CI = GITLAB_CI_TEMPLATE.strip() + "\n"
+
+
+def _write_file(path: Path, content: str, mode: int | None = None) -> None:
+    """Write a generated file, optionally setting its permissions.
+
+    Args:
+        path: File path to write
+        content: File content
+        mode: Permission bits to apply after writing, if any
+    """
+    path.write_text(content)
+    if mode is not None:
+        path.chmod(mode)
+
 
 def create_github_workflows(base_path: Path, dry_run: bool = False) -> list[Path]:
     """Create GitHub Actions workflow files.
@@ -32,7 +56,7 @@ def create_github_workflows(base_path: Path, dry_run: bool = False) -> list[Path
 
     if not dry_run:
         workflows_dir.mkdir(parents=True, exist_ok=True)
-        workflow_file.write_text(GITHUB_WORKFLOW_TEMPLATE.strip() + "\n")
+        workflow_file.write_text(_GITHUB_WORKFLOW)
 
     return [workflow_file]
 
@@ -60,16 +84,20 @@ def create_azure_pipelines(base_path: Path, dry_run: bool = False) -> list[Path]
         azure_dir.mkdir(parents=True, exist_ok=True)
         scripts_dir.mkdir(parents=True, exist_ok=True)
 
-        ci_file.write_text(AZURE_CI_TEMPLATE.strip() + "\n")
-        pr_validation_file.write_text(AZURE_PR_VALIDATION_TEMPLATE.strip() + "\n")
-        validation_script.write_text(AZURE_PR_VALIDATION_SCRIPT.strip() + "\n")
-        branch_policies_readme.write_text(
-            AZURE_BRANCH_POLICIES_README.strip() + "\n"
-        )
-        ci_setup_readme.write_text(AZURE_CI_SETUP_README.strip() + "\n")
-
-        # Make script executable
-        validation_script.chmod(0o755)
+        files = [
+            (ci_file, _AZURE_CI, None),
+            (pr_validation_file, _AZURE_PR_VALIDATION, None),
+            # Make script executable
+            (validation_script, _AZURE_PR_VALIDATION_SCRIPT, 0o755),
+            (branch_policies_readme, _AZURE_BRANCH_POLICIES_README, None),
+            (ci_setup_readme, _AZURE_CI_SETUP_README, None),
+        ]
+
+        # The files are independent, so write them concurrently
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(_write_file, *file) for file in files]
+            for future in futures:
+                future.result()
 
     return [
         ci_file,
@@ -93,7 +121,7 @@ def create_gitlab_pipelines(base_path: Path, dry_run: bool = False) -> list[Path
     ci_file = base_path / ".gitlab-ci.yml"
 
     if not dry_run:
-        ci_file.write_text(GITLAB_CI_TEMPLATE.strip() + "\n")
+        ci_file.write_text(_GITLAB_CI)
 
     return [ci_file]
 
@@ -260,6 +288,6 @@ def check_existing_files(files: list[Path]) -> list[Path]:
         files: List of file paths to check
 
     Returns:
-        List of files that already exist
+        List of files that already exist (including dangling symlinks)
     """
-    return [f for f in files if f.exists()]
+    return [f for f in files if os.path.lexists(f)]
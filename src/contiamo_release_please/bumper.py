@@ -1,14 +1,16 @@
 """File version bumping for contiamo-release-please."""
 
+import functools
 import json
 import re
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
-import tomlkit
-import yaml
-from jsonpath_ng import parse
+# yaml, tomlkit and jsonpath_ng are imported where they are used, so CLI
+# commands that never bump files don't pay for loading them
 
 
 class FileBumperError(Exception):
@@ -17,6 +19,116 @@ class FileBumperError(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_jsonpath(path_spec: str) -> Any:
+    """Parse a JSONPath expression, caching the result.
+
+    jsonpath-ng's parser is expensive to run, and the same path spec is
+    typically used for many files.
+
+    Args:
+        path_spec: JSONPath expression (e.g., '$.version')
+
+    Returns:
+        Parsed JSONPath expression
+    """
+    from jsonpath_ng import parse
+
+    return parse(path_spec)
+
+
+def _is_already_set(matches: list[Any], version: str) -> bool:
+    """Check whether every JSONPath match already holds the version string.
+
+    Args:
+        matches: Matches returned by a JSONPath find()
+        version: Version string to set
+
+    Returns:
+        True if all matched values are already equal to the version
+    """
+    return all(
+        isinstance(match.value, str) and match.value == version for match in matches
+    )
+
+
+# Plain dotted paths such as '$.version' or '$.project.version'
+_SIMPLE_PATH_RE = re.compile(r"\$(?:\.[A-Za-z_][A-Za-z0-9_-]*)+")
+
+# Names the JSONPath lexer treats as keywords rather than field names
+_JSONPATH_RESERVED_WORDS = frozenset({"where", "wherenot"})
+
+
+@functools.lru_cache(maxsize=256)
+def _simple_path_keys(path_spec: str) -> tuple[str, ...] | None:
+    """Split a plain dotted JSONPath into its keys.
+
+    Args:
+        path_spec: JSONPath expression
+
+    Returns:
+        Tuple of keys, or None if the expression needs full JSONPath handling
+    """
+    if not _SIMPLE_PATH_RE.fullmatch(path_spec):
+        return None
+
+    keys = tuple(path_spec.split(".")[1:])
+    if _JSONPATH_RESERVED_WORDS.intersection(keys):
+        return None
+
+    return keys
+
+
+def _set_path_value(data: Any, path_spec: str, version: str, file_path: Path) -> bool:
+    """Set the value(s) at a JSONPath to the version string.
+
+    Plain dotted paths are resolved by walking the dictionaries directly;
+    anything else (wildcards, filters, indices) goes through jsonpath-ng.
+
+    Args:
+        data: Parsed document
+        path_spec: JSONPath expression (e.g., '$.version')
+        version: Version string to set
+        file_path: Path of the document, for error messages
+
+    Returns:
+        True if the document was changed, False if it already had the version
+
+    Raises:
+        FileBumperError: If the path is not found
+    """
+    keys = _simple_path_keys(path_spec)
+
+    if keys is None:
+        jsonpath_expr = _parse_jsonpath(path_spec)
+        matches = jsonpath_expr.find(data)
+        if not matches:
+            raise FileBumperError(f"Path '{path_spec}' not found in {file_path}")
+
+        if _is_already_set(matches, version):
+            return False
+
+        # Update all matching paths
+        jsonpath_expr.update(data, version)
+        return True
+
+    container = data
+    for key in keys[:-1]:
+        if not isinstance(container, dict) or key not in container:
+            raise FileBumperError(f"Path '{path_spec}' not found in {file_path}")
+        container = container[key]
+
+    if not isinstance(container, dict) or keys[-1] not in container:
+        raise FileBumperError(f"Path '{path_spec}' not found in {file_path}")
+
+    current = container[keys[-1]]
+    if isinstance(current, str) and current == version:
+        return False
+
+    container[keys[-1]] = version
+    return True
+
+
 class FileBumper(ABC):
     """Abstract base class for file version bumpers."""
 
@@ -49,31 +161,32 @@ class YamlFileBumper(FileBumper):
         Raises:
             FileBumperError: If file not found, invalid path, or write fails
         """
+        import yaml
+
         if not file_path.exists():
             raise FileBumperError(f"File not found: {file_path}")
 
         try:
-            # Read YAML file
-            with open(file_path, "r") as f:
-                data = yaml.safe_load(f)
+            # Read YAML file, preferring the libyaml C bindings when available
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            data = yaml.load(file_path.read_text(), Loader=loader)
 
             if data is None:
                 raise FileBumperError(f"Empty or invalid YAML file: {file_path}")
 
-            # Parse JSONPath
-            jsonpath_expr = parse(path_spec)
-
-            # Find and update the value
-            matches = jsonpath_expr.find(data)
-            if not matches:
-                raise FileBumperError(f"Path '{path_spec}' not found in {file_path}")
-
-            # Update all matching paths
-            jsonpath_expr.update(data, version)
+            # Find and update the value; nothing to do if already at this version
+            if not _set_path_value(data, path_spec, version, file_path):
+                return
 
             # Write back to file
-            with open(file_path, "w") as f:
-                yaml.safe_dump(data, f, default_flow_style=False, sort_keys=False)
+            file_path.write_text(
+                yaml.dump(
+                    data,
+                    Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+                    default_flow_style=False,
+                    sort_keys=False,
+                )
+            )
 
         except yaml.YAMLError as e:
             raise FileBumperError(f"YAML parsing error in {file_path}: {e}")
@@ -95,28 +208,21 @@ class TomlFileBumper(FileBumper):
         Raises:
             FileBumperError: If file not found, invalid path, or write fails
         """
+        import tomlkit
+
         if not file_path.exists():
             raise FileBumperError(f"File not found: {file_path}")
 
         try:
             # Read TOML file (preserves formatting and comments)
-            with open(file_path, "r") as f:
-                data = tomlkit.load(f)
-
-            # Parse JSONPath
-            jsonpath_expr = parse(path_spec)
-
-            # Find and update the value
-            matches = jsonpath_expr.find(data)
-            if not matches:
-                raise FileBumperError(f"Path '{path_spec}' not found in {file_path}")
+            data = tomlkit.parse(file_path.read_text())
 
-            # Update all matching paths
-            jsonpath_expr.update(data, version)
+            # Find and update the value; nothing to do if already at this version
+            if not _set_path_value(data, path_spec, version, file_path):
+                return
 
             # Write back to file (preserves formatting and comments)
-            with open(file_path, "w") as f:
-                tomlkit.dump(data, f)
+            file_path.write_text(tomlkit.dumps(data))
 
         except Exception as e:
             # Catch all TOML errors (tomlkit uses various exception types)
@@ -144,27 +250,17 @@ class JsonFileBumper(FileBumper):
 
         try:
             # Read JSON file
-            with open(file_path, "r") as f:
-                data = json.load(f)
+            data = json.loads(file_path.read_text())
 
             if data is None:
                 raise FileBumperError(f"Empty or invalid JSON file: {file_path}")
 
-            # Parse JSONPath
-            jsonpath_expr = parse(path_spec)
+            # Find and update the value; nothing to do if already at this version
+            if not _set_path_value(data, path_spec, version, file_path):
+                return
 
-            # Find and update the value
-            matches = jsonpath_expr.find(data)
-            if not matches:
-                raise FileBumperError(f"Path '{path_spec}' not found in {file_path}")
-
-            # Update all matching paths
-            jsonpath_expr.update(data, version)
-
-            # Write back to file with consistent formatting
-            with open(file_path, "w") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-                f.write("\n")  # Add trailing newline
+            # Write back to file with consistent formatting and a trailing newline
+            file_path.write_text(json.dumps(data, indent=2, ensure_ascii=False) + "\n")
 
         except json.JSONDecodeError as e:
             raise FileBumperError(f"JSON parsing error in {file_path}: {e}")
@@ -182,6 +278,11 @@ class GenericFileBumper(FileBumper):
     # Version regex pattern (matches semantic versions with optional 'v' prefix)
     VERSION_PATTERN = re.compile(r"\bv?\d+\.\d+\.\d+\b")
 
+    # Whole line (including its newline) containing either marker
+    MARKER_LINE_PATTERN = re.compile(
+        r"^[^\n]*contiamo-release-please-bump-(?:start|end)[^\n]*\n?", re.MULTILINE
+    )
+
     def bump_version(self, file_path: Path, path_spec: str, version: str) -> None:
         """Bump version in a generic file using marker comments.
 
@@ -201,55 +302,51 @@ class GenericFileBumper(FileBumper):
 
         try:
             # Read file
-            with open(file_path, "r") as f:
-                lines = f.readlines()
-
-            # Track state and modified lines
-            inside_block = False
-            found_markers = False
-            modified_lines = []
-            versions_replaced = 0
-
-            for line in lines:
-                # Check for start marker
-                if self.START_MARKER in line:
-                    inside_block = True
-                    found_markers = True
-                    modified_lines.append(line)
-                    continue
-
-                # Check for end marker
-                if self.END_MARKER in line:
-                    inside_block = False
-                    modified_lines.append(line)
-                    continue
-
-                # If inside block, replace version strings
-                if inside_block:
-                    # Replace all version occurrences on this line
-                    original_line = line
-                    line = self.VERSION_PATTERN.sub(version, line)
-                    if line != original_line:
-                        versions_replaced += 1
+            content = file_path.read_text()
 
-                modified_lines.append(line)
-
-            # Validate markers were found
-            if not found_markers:
+            # Validate markers were found before doing any other work
+            if self.START_MARKER not in content:
                 raise FileBumperError(
                     f"No '{self.START_MARKER}' markers found in {file_path}. "
                     f"Add marker comments to indicate where versions should be updated."
                 )
 
+            # Walk the marker lines only; the text between two marker lines is
+            # rewritten in one go when it follows a start marker
+            inside_block = False
+            parts = []
+            versions_replaced = 0
+            position = 0
+
+            for marker_line in self.MARKER_LINE_PATTERN.finditer(content):
+                text = content[position : marker_line.start()]
+                if inside_block:
+                    text, count = self.VERSION_PATTERN.subn(version, text)
+                    versions_replaced += count
+                parts.append(text)
+                parts.append(marker_line.group())
+
+                # A start marker takes precedence if a line has both
+                inside_block = self.START_MARKER in marker_line.group()
+                position = marker_line.end()
+
+            # An unterminated block runs to the end of the file
+            text = content[position:]
+            if inside_block:
+                text, count = self.VERSION_PATTERN.subn(version, text)
+                versions_replaced += count
+            parts.append(text)
+
             # Validate at least one version was replaced
             if versions_replaced == 0:
                 raise FileBumperError(
                     f"No version strings found between markers in {file_path}"
                 )
 
-            # Write back to file
-            with open(file_path, "w") as f:
-                f.writelines(modified_lines)
+            # Write back to file, unless it is already at this version
+            new_content = "".join(parts)
+            if new_content != content:
+                file_path.write_text(new_content)
 
         except FileBumperError:
             # Re-raise our own errors
@@ -258,6 +355,15 @@ class GenericFileBumper(FileBumper):
             raise FileBumperError(f"Failed to bump version in {file_path}: {e}")
 
 
+# Bumpers are stateless, so a single instance of each is shared
+_BUMPERS: dict[str, FileBumper] = {
+    "yaml": YamlFileBumper(),
+    "toml": TomlFileBumper(),
+    "json": JsonFileBumper(),
+    "generic": GenericFileBumper(),
+}
+
+
 def get_bumper_for_type(file_type: str) -> FileBumper:
     """Get the appropriate bumper for a file type.
 
@@ -270,100 +376,163 @@ def get_bumper_for_type(file_type: str) -> FileBumper:
     Raises:
         FileBumperError: If file type is not supported
     """
-    bumpers = {
-        "yaml": YamlFileBumper(),
-        "toml": TomlFileBumper(),
-        "json": JsonFileBumper(),
-        "generic": GenericFileBumper(),
-    }
-
-    bumper = bumpers.get(file_type)
+    bumper = _BUMPERS.get(file_type)
     if not bumper:
         raise FileBumperError(
-            f"Unsupported file type: {file_type}. Supported types: {', '.join(bumpers.keys())}"
+            f"Unsupported file type: {file_type}. Supported types: {', '.join(_BUMPERS.keys())}"
         )
 
     return bumper
 
 
-def bump_files(
-    extra_files: list[dict[str, Any]],
-    version: str,
-    git_root: Path,
-    dry_run: bool = False,
-) -> dict[str, list[str]]:
-    """Bump version in multiple files according to configuration.
+class PreparedFile(NamedTuple):
+    """A validated extra-files entry, ready to be bumped."""
+
+    file_type: str
+    file_path: Path
+    path_spec: str
+    value: str
+    summary: str
+
+
+# Config field holding the path spec, and display name, per structured type
+_PATH_SPEC_FIELDS = {
+    "yaml": ("yaml-path", "YAML"),
+    "toml": ("toml-path", "TOML"),
+    "json": ("json-path", "JSON"),
+}
+
+
+def _prepare_files(
+    extra_files: Sequence[dict[str, Any]], version: str, git_root: Path
+) -> list[PreparedFile | str]:
+    """Validate extra-files configuration and resolve what to bump.
 
     Args:
         extra_files: List of file configurations from config
         version: Version string (without prefix)
         git_root: Git repository root path
-        dry_run: If True, don't write changes
 
     Returns:
-        Dictionary with 'updated' and 'errors' lists
-
-    Raises:
-        FileBumperError: If configuration is invalid
+        One item per file configuration, in order: a PreparedFile, or an
+        error message if the configuration is invalid
     """
-    results = {"updated": [], "errors": []}
+    prepared: list[PreparedFile | str] = []
 
     for file_config in extra_files:
         # Validate required fields
         if "type" not in file_config:
-            results["errors"].append("Missing 'type' field in file configuration")
+            prepared.append("Missing 'type' field in file configuration")
             continue
 
         if "path" not in file_config:
-            results["errors"].append("Missing 'path' field in file configuration")
+            prepared.append("Missing 'path' field in file configuration")
             continue
 
         file_type = file_config["type"]
-        file_path = git_root / file_config["path"]
 
         # Get path specification based on file type
-        if file_type == "yaml":
-            path_spec = file_config.get("yaml-path")
-            if not path_spec:
-                results["errors"].append(
-                    f"Missing 'yaml-path' for YAML file: {file_config['path']}"
-                )
-                continue
-        elif file_type == "toml":
-            path_spec = file_config.get("toml-path")
-            if not path_spec:
-                results["errors"].append(
-                    f"Missing 'toml-path' for TOML file: {file_config['path']}"
-                )
-                continue
-        elif file_type == "json":
-            path_spec = file_config.get("json-path")
+        if file_type in _PATH_SPEC_FIELDS:
+            field, label = _PATH_SPEC_FIELDS[file_type]
+            path_spec = file_config.get(field)
             if not path_spec:
-                results["errors"].append(
-                    f"Missing 'json-path' for JSON file: {file_config['path']}"
+                prepared.append(
+                    f"Missing '{field}' for {label} file: {file_config['path']}"
                 )
                 continue
         elif file_type == "generic":
             # Generic files don't need a path_spec (uses markers instead)
             path_spec = ""
         else:
-            results["errors"].append(f"Unsupported file type: {file_type}")
+            prepared.append(f"Unsupported file type: {file_type}")
             continue
 
         # Apply prefix if specified
         use_prefix = file_config.get("use-prefix", "")
         versioned_value = f"{use_prefix}{version}" if use_prefix else version
 
-        try:
-            if not dry_run:
-                bumper = get_bumper_for_type(file_type)
-                bumper.bump_version(file_path, path_spec, versioned_value)
-
-            results["updated"].append(
-                f"{file_config['path']}:{path_spec} → {versioned_value}"
+        prepared.append(
+            PreparedFile(
+                file_type=file_type,
+                file_path=git_root / file_config["path"],
+                path_spec=path_spec,
+                value=versioned_value,
+                summary=f"{file_config['path']}:{path_spec} → {versioned_value}",
             )
+        )
+
+    return prepared
 
-        except FileBumperError as e:
-            results["errors"].append(str(e))
+
+def _bump_concurrently(prepared: list[PreparedFile | str]) -> dict[int, str]:
+    """Bump the prepared files, running independent files in parallel.
+
+    Entries for the same file are applied in order on a single worker, so
+    concurrent writes never target the same file.
+
+    Args:
+        prepared: Prepared files and validation error messages, in config order
+
+    Returns:
+        Dictionary mapping entry index to error message for failed bumps
+    """
+    by_file: dict[Path, list[tuple[int, PreparedFile]]] = {}
+    for index, entry in enumerate(prepared):
+        if isinstance(entry, PreparedFile):
+            by_file.setdefault(entry.file_path.resolve(), []).append((index, entry))
+
+    def bump_one_file(file_entries: list[tuple[int, PreparedFile]]) -> dict[int, str]:
+        errors = {}
+        for index, entry in file_entries:
+            try:
+                bumper = get_bumper_for_type(entry.file_type)
+                bumper.bump_version(entry.file_path, entry.path_spec, entry.value)
+            except FileBumperError as e:
+                errors[index] = str(e)
+        return errors
+
+    if len(by_file) <= 1:
+        return bump_one_file(next(iter(by_file.values()), []))
+
+    errors: dict[int, str] = {}
+    with ThreadPoolExecutor(max_workers=min(8, len(by_file))) as executor:
+        for file_errors in executor.map(bump_one_file, by_file.values()):
+            errors.update(file_errors)
+    return errors
+
+
+def bump_files(
+    extra_files: Sequence[dict[str, Any]],
+    version: str,
+    git_root: Path,
+    dry_run: bool = False,
+) -> dict[str, list[str]]:
+    """Bump version in multiple files according to configuration.
+
+    Args:
+        extra_files: List of file configurations from config
+        version: Version string (without prefix)
+        git_root: Git repository root path
+        dry_run: If True, don't write changes
+
+    Returns:
+        Dictionary with 'updated' and 'errors' lists
+
+    Raises:
+        FileBumperError: If configuration is invalid
+    """
+    results = {"updated": [], "errors": []}
+
+    prepared = _prepare_files(extra_files, version, git_root)
+    bump_errors = {} if dry_run else _bump_concurrently(prepared)
+
+    # Report in configuration order
+    for index, entry in enumerate(prepared):
+        if isinstance(entry, str):
+            results["errors"].append(entry)
+        elif index in bump_errors:
+            results["errors"].append(bump_errors[index])
+        else:
+            results["updated"].append(entry.summary)
 
     return results
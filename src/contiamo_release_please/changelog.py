@@ -1,11 +1,21 @@
 """Changelog generation for contiamo-release-please."""
 
+import io
+import re
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
 
 from contiamo_release_please.analyser import ParsedCommit, parse_commit_message
 from contiamo_release_please.config import ReleaseConfig
 
+# Start of any release section header
+_SECTION_HEADER_RE = re.compile(r"^## ", re.MULTILINE)
+
+# Leading/trailing lines that are empty or whitespace-only
+_LEADING_BLANK_LINES_RE = re.compile(r"\A(?:[^\S\n]*\n)+")
+_TRAILING_BLANK_LINES_RE = re.compile(r"(?:\n[^\S\n]*)+\Z")
+
 
 def group_commits_by_section(
     commit_messages: list[str], config: ReleaseConfig
@@ -19,17 +29,10 @@ def group_commits_by_section(
     Returns:
         Dictionary mapping section names to lists of parsed commits
     """
-    sections = config.get_changelog_sections()
-
-    # Create mapping from commit type to section name
-    type_to_section: dict[str, str] = {}
-    for section_config in sections:
-        commit_type = section_config["type"]
-        section_name = section_config["section"]
-        type_to_section[commit_type] = section_name
+    type_to_section = config.type_to_section_map
 
     # Group commits by section
-    grouped: dict[str, list[ParsedCommit]] = {}
+    grouped: defaultdict[str, list[ParsedCommit]] = defaultdict(list)
 
     for message in commit_messages:
         parsed = parse_commit_message(message)
@@ -45,12 +48,9 @@ def group_commits_by_section(
             continue
 
         # Add to grouped commits
-        if section_name not in grouped:
-            grouped[section_name] = []
-
         grouped[section_name].append(parsed)
 
-    return grouped
+    return dict(grouped)
 
 
 def format_changelog_entry(
@@ -73,27 +73,16 @@ def format_changelog_entry(
     if date is None:
         date = datetime.now().strftime("%Y-%m-%d")
 
-    lines = [f"## [{version}] ({date})", ""]
-
-    # Get section order from config
-    sections = config.get_changelog_sections()
-    section_order = [s["section"] for s in sections]
-
-    # Remove duplicates whilst preserving order
-    seen = set()
-    section_order = [x for x in section_order if not (x in seen or seen.add(x))]
+    output = io.StringIO()
+    output.write(f"## [{version}] ({date})\n")
 
-    # Add sections in order
-    for section_name in section_order:
-        if section_name not in grouped_commits:
-            continue
-
-        commits = grouped_commits[section_name]
+    # Add sections in configured order
+    for section_name in config.ordered_section_names:
+        commits = grouped_commits.get(section_name)
         if not commits:
             continue
 
-        lines.append(f"### {section_name}")
-        lines.append("")
+        output.write(f"\n### {section_name}\n\n")
 
         # Add each commit as a bullet point
         for commit in commits:
@@ -101,13 +90,41 @@ def format_changelog_entry(
             scope = commit["scope"]
 
             if scope:
-                lines.append(f"* **{scope}**: {description}")
+                output.write(f"* **{scope}**: {description}\n")
             else:
-                lines.append(f"* {description}")
+                output.write(f"* {description}\n")
+
+    return output.getvalue()
+
+
+def extract_changelog_entry(content: str, version: str) -> str | None:
+    """Extract the entry for a specific version from changelog content.
+
+    Args:
+        content: Changelog content
+        version: Version number to extract (without prefix, e.g., "1.2.3")
+
+    Returns:
+        Changelog entry content (without the version header), or None if not found
+    """
+    # Find the version header line (e.g., "## [1.2.3] (2025-01-01)")
+    header = re.search(rf"^## \[{re.escape(version)}\][^\n]*\n?", content, re.MULTILINE)
+    if header is None:
+        return None
+
+    # Find the end of this version section (next ## header or end of file)
+    next_header = _SECTION_HEADER_RE.search(content, header.end())
+    if next_header:
+        # Exclude the newline that ends the section's last line
+        entry = content[header.end() : next_header.start() - 1]
+    else:
+        entry = content[header.end() :]
 
-        lines.append("")
+    # Remove leading/trailing empty lines
+    entry = _LEADING_BLANK_LINES_RE.sub("", entry)
+    entry = _TRAILING_BLANK_LINES_RE.sub("", entry)
 
-    return "\n".join(lines)
+    return entry if entry.strip() else None
 
 
 def extract_changelog_for_version(changelog_path: Path, version: str) -> str | None:
@@ -123,40 +140,52 @@ def extract_changelog_for_version(changelog_path: Path, version: str) -> str | N
     if not changelog_path.exists():
         return None
 
-    with open(changelog_path, "r") as f:
-        content = f.read()
-
-    lines = content.split("\n")
-
-    # Find the version header line (e.g., "## [1.2.3] (2025-01-01)")
-    version_header_pattern = f"## [{version}]"
-    start_index = None
-
-    for i, line in enumerate(lines):
-        if line.startswith(version_header_pattern):
-            start_index = i
-            break
+    return extract_changelog_entry(changelog_path.read_text(), version)
 
-    if start_index is None:
-        return None
 
-    # Find the end of this version section (next ## header or end of file)
-    end_index = len(lines)
-    for i in range(start_index + 1, len(lines)):
-        if lines[i].startswith("## "):
-            end_index = i
-            break
+def prepend_changelog_entry(existing_content: str, new_entry: str) -> str:
+    """Prepend a new entry to changelog content.
 
-    # Extract the content (excluding the version header itself)
-    entry_lines = lines[start_index + 1 : end_index]
+    Args:
+        existing_content: Current changelog content
+        new_entry: New changelog entry to prepend
 
-    # Remove leading/trailing empty lines
-    while entry_lines and entry_lines[0].strip() == "":
-        entry_lines.pop(0)
-    while entry_lines and entry_lines[-1].strip() == "":
-        entry_lines.pop()
+    Returns:
+        Updated changelog content
+    """
+    # If existing content has a header, insert after it
+    if existing_content.startswith("# Changelog"):
+        first_release = _SECTION_HEADER_RE.search(existing_content)
+        if first_release:
+            # Insert directly before the most recent release
+            position = first_release.start()
+            new_content = (
+                existing_content[:position]
+                + new_entry
+                + "\n"
+                + existing_content[position:]
+            )
+        else:
+            # No releases yet: find the end of the header section (intro paragraph)
+            lines = existing_content.split("\n")
+            insert_position = 0
+
+            for i, line in enumerate(lines):
+                if i > 0 and line.strip() == "" and i < len(lines) - 1:
+                    if lines[i + 1].strip() != "":
+                        insert_position = i + 1
+
+            if insert_position == 0:
+                # No existing releases, append after header
+                insert_position = len(lines)
+
+            lines.insert(insert_position, new_entry)
+            new_content = "\n".join(lines)
+    else:
+        # No header, just prepend
+        new_content = new_entry + "\n" + existing_content
 
-    return "\n".join(entry_lines) if entry_lines else None
+    return new_content
 
 
 def prepend_to_changelog(
@@ -171,38 +200,10 @@ def prepend_to_changelog(
     """
     # Read existing content
     if changelog_path.exists():
-        with open(changelog_path, "r") as f:
-            existing_content = f.read()
+        existing_content = changelog_path.read_text()
     else:
         if not create_if_missing:
             raise FileNotFoundError(f"Changelog file not found: {changelog_path}")
         existing_content = "# Changelog\n\nAll notable changes to this project will be documented in this file.\n\n"
 
-    # Prepend new entry
-    # If existing content has a header, insert after it
-    if existing_content.startswith("# Changelog"):
-        # Find the end of the header section (first ## or end of intro paragraph)
-        lines = existing_content.split("\n")
-        insert_position = 0
-
-        for i, line in enumerate(lines):
-            if line.startswith("## "):
-                insert_position = i
-                break
-            if i > 0 and line.strip() == "" and i < len(lines) - 1:
-                if lines[i + 1].strip() != "":
-                    insert_position = i + 1
-
-        if insert_position == 0:
-            # No existing releases, append after header
-            insert_position = len(lines)
-
-        lines.insert(insert_position, new_entry)
-        new_content = "\n".join(lines)
-    else:
-        # No header, just prepend
-        new_content = new_entry + "\n" + existing_content
-
-    # Write updated content
-    with open(changelog_path, "w") as f:
-        f.write(new_content)
+    changelog_path.write_text(prepend_changelog_entry(existing_content, new_entry))
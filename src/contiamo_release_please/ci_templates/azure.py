@@ -6,6 +6,9 @@ AZURE_CI_TEMPLATE = """variables:
   - name: IS_RELEASE_PR_MERGE
     # Matches: "Merged PR X: chore(main): release 0.1.0"
     value: $[and(contains(variables['Build.SourceVersionMessage'], 'Merged PR'), and(contains(variables['Build.SourceVersionMessage'], 'chore(main)'), contains(variables['Build.SourceVersionMessage'], 'release')))]
+  - name: UV_CACHE_DIR
+    # Outside the checkout so the cache never ends up in a release commit
+    value: $(Pipeline.Workspace)/.uv-cache
 
 pool:
   vmImage: ubuntu-latest
@@ -21,15 +24,23 @@ trigger:
 pr: none
 
 jobs:
-  # Release PR Creation - runs on pushes to main (except release PR merges)
-  - job: CreateReleasePR
-    displayName: "Create or Update Release PR"
-    condition: and(eq(variables['Build.SourceBranchName'], 'main'), eq(variables['Build.Reason'], 'IndividualCI'), ne(variables['IS_RELEASE_PR_MERGE'], 'True'))
+  # Single job: installs the tool once, then either creates/updates the release PR
+  # (pushes to main) or tags the release (release PR merges)
+  - job: ReleasePlease
+    displayName: "Release Please"
+    condition: and(eq(variables['Build.SourceBranchName'], 'main'), or(eq(variables['IS_RELEASE_PR_MERGE'], 'True'), eq(variables['Build.Reason'], 'IndividualCI')))
     steps:
       - checkout: self
-        fetchDepth: 0
+        # History is deepened automatically if the last release is older
+        fetchDepth: 50
         persistCredentials: true
-        displayName: "Checkout with full history"
+        displayName: "Checkout recent history"
+
+      - task: Cache@2
+        inputs:
+          key: 'uv | "$(Agent.OS)"'
+          path: $(UV_CACHE_DIR)
+        displayName: "Cache uv downloads"
 
       - bash: |
           curl -LsSf https://astral.sh/uv/install.sh | sh
@@ -38,39 +49,27 @@ jobs:
           uv tool install git+https://github.com/contiamo/contiamo-release-please.git
         displayName: "Install uv, Python 3.12, and contiamo-release-please"
 
+      # Release PR Creation - runs on pushes to main (except release PR merges)
       - bash: |
           export PATH="$HOME/.local/bin:$PATH"
           contiamo-release-please release --verbose
         displayName: "Create or update release PR"
+        condition: and(succeeded(), ne(variables['IS_RELEASE_PR_MERGE'], 'True'))
         env:
           AZURE_DEVOPS_TOKEN: $(System.AccessToken)
 
-  # Tag and Release Creation - runs only on release PR merges
-  - job: CreateTagAndRelease
-    displayName: "Create Git Tag and Release"
-    condition: and(eq(variables['Build.SourceBranchName'], 'main'), eq(variables['IS_RELEASE_PR_MERGE'], 'True'))
-    steps:
-      - checkout: self
-        fetchDepth: 0
-        persistCredentials: true
-        displayName: "Checkout with full history"
-
+      # Tag and Release Creation - runs only on release PR merges
       - bash: |
           git checkout main
           git pull origin main
         displayName: "Ensure we're on main branch"
-
-      - bash: |
-          curl -LsSf https://astral.sh/uv/install.sh | sh
-          export PATH="$HOME/.local/bin:$PATH"
-          uv python install 3.12
-          uv tool install git+https://github.com/contiamo/contiamo-release-please.git
-        displayName: "Install uv, Python 3.12, and contiamo-release-please"
+        condition: and(succeeded(), eq(variables['IS_RELEASE_PR_MERGE'], 'True'))
 
       - bash: |
           export PATH="$HOME/.local/bin:$PATH"
           contiamo-release-please tag-release --verbose
         displayName: "Create and push git tag"
+        condition: and(succeeded(), eq(variables['IS_RELEASE_PR_MERGE'], 'True'))
         env:
           AZURE_DEVOPS_TOKEN: $(System.AccessToken)
 """
@@ -86,14 +85,6 @@ jobs:
       - checkout: self
         displayName: "Checkout code"
 
-      - bash: |
-          # Install jq for JSON parsing
-          if command -v sudo >/dev/null 2>&1; then
-            sudo apt-get update && sudo apt-get install -y jq
-          else
-            apt-get update && apt-get install -y jq
-          fi
-        displayName: "Install jq"
       - bash: |
           # Validate PR title
           .azure/scripts/validate-pr-title.sh
@@ -124,7 +115,7 @@ PROJECT_NAME=$(echo "$BUILD_REPOSITORY_URI" | sed 's/.*\\.com\\/[^\\/]*\\///; s/
 PR_TITLE=$(curl -s \\
     -H "Authorization: Bearer $SYSTEM_ACCESSTOKEN" \\
     "${SYSTEM_COLLECTIONURI}${PROJECT_NAME}/_apis/git/repositories/${REPO_NAME}/pullrequests/${SYSTEM_PULLREQUEST_PULLREQUESTID}?api-version=7.1" \\
-    | jq -r '.title')
+    | python3 -c "import json, sys; print(json.load(sys.stdin).get('title') or '')")
 
 if [ -z "$PR_TITLE" ]; then
     echo "❌ Could not retrieve PR title"
@@ -133,6 +124,11 @@ fi
 
 echo "PR Title: $PR_TITLE"
 
+# Prefer the tool's validator when it is installed on the agent
+if command -v contiamo-release-please >/dev/null 2>&1; then
+    exec contiamo-release-please validate-title "$PR_TITLE"
+fi
+
 # Conventional commit pattern with common types
 # Matches: type(optional-scope): description or type: description
 PATTERN="^(feat|fix|chore|ci|docs|refactor|test|perf|style|build)(\\(.+\\))?(!)?(:[[:space:]]+.+|!:[[:space:]]+.+)"
@@ -1,13 +1,6 @@
 """Configuration template generation for Contiamo Release Please."""
 
-
-def generate_config_template() -> str:
-    """Generate a complete configuration file template with all parameters documented.
-
-    Returns:
-        YAML configuration template as a string with inline documentation
-    """
-    template = """# Contiamo Release Please Configuration
+_CONFIG_TEMPLATE = """# Contiamo Release Please Configuration
 #
 # This file defines how conventional commits map to semantic version bumps.
 # For more information, visit: https://github.com/contiamo/contiamo-release-please
@@ -194,4 +187,12 @@ extra-files: []
 #
 # Note: Works with both gitlab.com and self-hosted GitLab instances
 """
-    return template
+
+
+def generate_config_template() -> str:
+    """Generate a complete configuration file template with all parameters documented.
+
+    Returns:
+        YAML configuration template as a string with inline documentation
+    """
+    return _CONFIG_TEMPLATE
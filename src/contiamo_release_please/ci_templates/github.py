@@ -13,7 +13,7 @@ jobs:
     steps:
       - uses: actions/checkout@v6
         with:
-          fetch-depth: 0 # Required: Fetch all history for commit analysis
+          fetch-depth: 50 # History is deepened automatically if the last release is older
 
       - uses: contiamo/contiamo-release-please@main
         id: release
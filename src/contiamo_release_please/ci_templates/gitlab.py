@@ -6,8 +6,15 @@ GITLAB_CI_TEMPLATE = """stages:
 variables:
   # Use project access token for API and git push authentication
   GITLAB_TOKEN: $CICD_TOKEN
-  # Fetch full git history for commit analysis
-  GIT_DEPTH: 0
+  # Shallow clone; history is deepened automatically if the last release is older
+  GIT_DEPTH: 50
+  # Cache uv downloads between pipelines (cache paths must be inside the project)
+  UV_CACHE_DIR: .uv-cache
+
+cache:
+  key: uv-$CI_COMMIT_REF_SLUG
+  paths:
+    - .uv-cache
 
 # Create or update release merge request
 create-release-mr:
@@ -16,6 +23,8 @@ create-release-mr:
   before_script:
     # Install git (required for cloning the tool and git operations)
     - apk add --no-cache git
+    # Keep the uv cache out of the release commit
+    - echo ".uv-cache/" >> .git/info/exclude
     # Configure git remote with token authentication for push operations
     # Uses GitLab CI variables: CI_SERVER_HOST, CI_PROJECT_PATH, and CICD_TOKEN
     - git remote set-url origin "https://oauth2:${CICD_TOKEN}@${CI_SERVER_HOST}/${CI_PROJECT_PATH}.git"
@@ -34,6 +43,9 @@ create-release-mr:
 create-tag-and-release:
   stage: release
   image: ghcr.io/astral-sh/uv:python3.12-alpine
+  variables:
+    # Tagging job keeps the full clone
+    GIT_DEPTH: 0
   before_script:
     # Install git (required for cloning the tool and git operations)
     - apk add --no-cache git
@@ -1,9 +1,23 @@
 """Configuration loading and parsing for contiamo-release-please."""
 
+import functools
+from collections.abc import Mapping, Sequence
 from pathlib import Path
 from typing import Any
 
-import yaml
+# Shared read-only defaults, returned as-is when the config omits the key
+_DEFAULT_CHANGELOG_SECTIONS: tuple[dict[str, str], ...] = (
+    {"type": "feat", "section": "Features"},
+    {"type": "fix", "section": "Bug Fixes"},
+    {"type": "chore", "section": "Miscellaneous Changes"},
+    {"type": "ci", "section": "Miscellaneous Changes"},
+    {"type": "docs", "section": "Documentation"},
+    {"type": "refactor", "section": "Code Refactoring"},
+)
+_NO_EXTRA_FILES: tuple[dict[str, Any], ...] = ()
+
+# Raw config sections kept after loading, for git host API token lookup
+_GIT_HOST_SECTIONS = ("github", "azure", "gitlab")
 
 
 class ConfigError(Exception):
@@ -13,7 +27,29 @@ class ConfigError(Exception):
 
 
 class ReleaseConfig:
-    """Release configuration loaded from YAML file."""
+    """Release configuration loaded from YAML file.
+
+    All values are derived eagerly when the file is loaded; afterwards only
+    the git host sections of the raw YAML are kept (for API token lookup).
+    """
+
+    __slots__ = (
+        "config_path",
+        "_config",
+        "_prefix_map",
+        "_all_prefixes",
+        "version_prefix",
+        "changelog_path",
+        "changelog_sections",
+        "type_to_section_map",
+        "ordered_section_names",
+        "extra_files",
+        "source_branch",
+        "release_branch_name",
+        "update_major_version_tag",
+        "git_user_name",
+        "git_user_email",
+    )
 
     def __init__(self, config_path: str | Path = "contiamo-release-please.yaml"):
         """Load release configuration from YAML file.
@@ -24,15 +60,57 @@ class ReleaseConfig:
         Raises:
             ConfigError: If config file doesn't exist or is invalid
         """
+        import yaml
+
         self.config_path = Path(config_path)
         if not self.config_path.exists():
             raise ConfigError(f"Configuration file not found: {self.config_path}")
 
-        with open(self.config_path, "r") as f:
-            self._config: dict[str, Any] = yaml.safe_load(f)
+        # Prefer the libyaml C loader; it decodes the raw bytes itself, so
+        # skip the text layer
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        with open(self.config_path, "rb") as f:
+            self._config: dict[str, Any] = yaml.load(f, Loader=loader)
 
         self._validate_config()
 
+        config = self._config
+        self.version_prefix: str = config.get("version-prefix", "")
+        self.changelog_path: str = config.get("changelog-path", "CHANGELOG.md")
+
+        self.changelog_sections: Sequence[dict[str, str]] = config.get(
+            "changelog-sections", _DEFAULT_CHANGELOG_SECTIONS
+        )
+        self.type_to_section_map: dict[str, str] = {
+            section_config["type"]: section_config["section"]
+            for section_config in self.changelog_sections
+        }
+        # dict.fromkeys removes duplicates whilst preserving order
+        self.ordered_section_names: tuple[str, ...] = tuple(
+            dict.fromkeys(s["section"] for s in self.changelog_sections)
+        )
+
+        self.extra_files: Sequence[dict[str, Any]] = config.get(
+            "extra-files", _NO_EXTRA_FILES
+        )
+        self.source_branch: str = config.get("source-branch", "main")
+        # Default: release-please--branches--{source-branch}
+        self.release_branch_name: str = config.get(
+            "release-branch-name", f"release-please--branches--{self.source_branch}"
+        )
+        self.update_major_version_tag: bool = bool(
+            config.get("update-major-version-tag", False)
+        )
+
+        git_config = config.get("git", {})
+        self.git_user_name: str = git_config.get("user-name", "Contiamo Release Bot")
+        self.git_user_email: str = git_config.get(
+            "user-email", "contiamo-release@ctmo.io"
+        )
+
+        # Drop the rest of the parsed YAML; token lookups only read these sections
+        self._config = {key: config[key] for key in _GIT_HOST_SECTIONS if key in config}
+
     def _validate_config(self) -> None:
         """Validate that required configuration sections exist."""
         if "release-rules" not in self._config:
@@ -54,6 +132,15 @@ class ReleaseConfig:
             if not isinstance(prefix, str):
                 raise ConfigError("'version-prefix' must be a string")
 
+        # Precompute prefix lookups; setdefault keeps major > minor > patch priority
+        self._prefix_map: dict[str, str] = {}
+        for release_type in ("major", "minor", "patch"):
+            prefixes = rules.get(release_type)
+            if isinstance(prefixes, list):
+                for prefix in prefixes:
+                    self._prefix_map.setdefault(prefix, release_type)
+        self._all_prefixes: frozenset[str] = frozenset(self._prefix_map)
+
     def get_release_type_for_prefix(self, prefix: str) -> str | None:
         """Determine release type (major/minor/patch) for a commit prefix.
 
@@ -63,33 +150,25 @@ class ReleaseConfig:
         Returns:
             Release type ('major', 'minor', or 'patch') or None if no match
         """
-        rules = self._config["release-rules"]
+        return self._prefix_map.get(prefix)
 
-        # Check in order of priority: major > minor > patch
-        for release_type in ["major", "minor", "patch"]:
-            if release_type in rules:
-                prefixes = rules[release_type]
-                if not isinstance(prefixes, list):
-                    continue
-                if prefix in prefixes:
-                    return release_type
+    def get_prefix_release_types(self) -> Mapping[str, str]:
+        """Get the mapping of commit prefixes to release types.
 
-        return None
-
-    def get_all_valid_prefixes(self) -> set[str]:
-        """Get all valid commit prefixes from configuration.
+        For callers classifying many prefixes at once.
 
         Returns:
-            Set of all valid prefixes
+            Read-only mapping of prefix to release type ('major', 'minor', or 'patch')
         """
-        prefixes = set()
-        rules = self._config["release-rules"]
+        return self._prefix_map
 
-        for release_type in ["major", "minor", "patch"]:
-            if release_type in rules and isinstance(rules[release_type], list):
-                prefixes.update(rules[release_type])
+    def get_all_valid_prefixes(self) -> frozenset[str]:
+        """Get all valid commit prefixes from configuration.
 
-        return prefixes
+        Returns:
+            Frozen set of all valid prefixes
+        """
+        return self._all_prefixes
 
     def get_version_prefix(self) -> str:
         """Get the version prefix from configuration.
@@ -97,7 +176,7 @@ class ReleaseConfig:
         Returns:
             Version prefix string (e.g., 'v', 'version-') or empty string if not configured
         """
-        return self._config.get("version-prefix", "")
+        return self.version_prefix
 
     def get_changelog_path(self) -> str:
         """Get the changelog file path from configuration.
@@ -105,33 +184,24 @@ class ReleaseConfig:
         Returns:
             Changelog file path or 'CHANGELOG.md' as default
         """
-        return self._config.get("changelog-path", "CHANGELOG.md")
+        return self.changelog_path
 
-    def get_changelog_sections(self) -> list[dict[str, str]]:
+    def get_changelog_sections(self) -> Sequence[dict[str, str]]:
         """Get changelog sections configuration.
 
         Returns:
-            List of section dictionaries with 'type' and 'section' keys.
-            Returns default sections if not configured.
+            Sequence of section dictionaries with 'type' and 'section' keys.
+            Returns the shared default sections if not configured; treat as read-only.
         """
-        default_sections = [
-            {"type": "feat", "section": "Features"},
-            {"type": "fix", "section": "Bug Fixes"},
-            {"type": "chore", "section": "Miscellaneous Changes"},
-            {"type": "ci", "section": "Miscellaneous Changes"},
-            {"type": "docs", "section": "Documentation"},
-            {"type": "refactor", "section": "Code Refactoring"},
-        ]
-
-        return self._config.get("changelog-sections", default_sections)
-
-    def get_extra_files(self) -> list[dict[str, Any]]:
+        return self.changelog_sections
+
+    def get_extra_files(self) -> Sequence[dict[str, Any]]:
         """Get extra files configuration for version bumping.
 
         Returns:
-            List of file configuration dictionaries
+            Sequence of file configuration dictionaries (empty if not configured)
         """
-        return self._config.get("extra-files", [])
+        return self.extra_files
 
     def get_source_branch(self) -> str:
         """Get the source branch name from configuration.
@@ -139,7 +209,7 @@ class ReleaseConfig:
         Returns:
             Source branch name or 'main' as default
         """
-        return self._config.get("source-branch", "main")
+        return self.source_branch
 
     def get_release_branch_name(self) -> str:
         """Get the release branch name from configuration.
@@ -147,12 +217,7 @@ class ReleaseConfig:
         Returns:
             Release branch name or generated default based on source branch
         """
-        if "release-branch-name" in self._config:
-            return self._config["release-branch-name"]
-
-        # Generate default: release-please--branches--{source-branch}
-        source_branch = self.get_source_branch()
-        return f"release-please--branches--{source_branch}"
+        return self.release_branch_name
 
     def get_update_major_version_tag(self) -> bool:
         """Get whether to automatically update the major version tag on release.
@@ -164,7 +229,7 @@ class ReleaseConfig:
         Returns:
             True if major version tag should be updated, False otherwise
         """
-        return bool(self._config.get("update-major-version-tag", False))
+        return self.update_major_version_tag
 
     def get_git_user_name(self) -> str:
         """Get git user name for commits.
@@ -172,8 +237,7 @@ class ReleaseConfig:
         Returns:
             Git user name or 'Contiamo Release Bot' as default
         """
-        git_config = self._config.get("git", {})
-        return git_config.get("user-name", "Contiamo Release Bot")
+        return self.git_user_name
 
     def get_git_user_email(self) -> str:
         """Get git user email for commits.
@@ -181,8 +245,17 @@ class ReleaseConfig:
         Returns:
             Git user email or 'contiamo-release@ctmo.io' as default
         """
-        git_config = self._config.get("git", {})
-        return git_config.get("user-email", "contiamo-release@ctmo.io")
+        return self.git_user_email
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_load(path: str, mtime_ns: int, size: int) -> ReleaseConfig:
+    """Parse a config file, memoised on its path and stat signature.
+
+    mtime_ns and size are only part of the cache key, so an edited file
+    gets a fresh entry instead of the stale parse.
+    """
+    return ReleaseConfig(path)
 
 
 def load_config(
@@ -190,6 +263,8 @@ def load_config(
 ) -> ReleaseConfig:
     """Load release configuration from file.
 
+    Repeated loads of an unchanged file return the same cached object.
+
     Args:
         config_path: Path to configuration file
 
@@ -199,4 +274,11 @@ def load_config(
     Raises:
         ConfigError: If config file is invalid or cannot be loaded
     """
-    return ReleaseConfig(config_path)
+    path = Path(config_path).resolve()
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        # Raised here rather than inside the cached call so misses aren't memoised
+        raise ConfigError(f"Configuration file not found: {config_path}") from None
+
+    return _cached_load(str(path), stat.st_mtime_ns, stat.st_size)
@@ -1,7 +1,12 @@
 """Git operations for contiamo-release-please."""
 
+import configparser
+import functools
+import os
 import re
 import subprocess
+import tempfile
+from collections.abc import Iterator
 from pathlib import Path
 
 
@@ -11,9 +16,40 @@ class GitError(Exception):
     pass
 
 
+# Commits fetched by the first --deepen round on a shallow clone; doubled each round
+_DEEPEN_STEP = 50
+# Past this depth stop deepening gradually and fetch the remaining history
+_MAX_DEEPEN = 800
+
+# Common tag prefixes like 'v', 'version-', etc.
+_TAG_PREFIX_RE = re.compile(r"^(?:v|version-?)", re.IGNORECASE)
+
+# Config sections that can change what `git remote get-url` returns
+_URL_CONFIG_SECTIONS = ("include", "url ")
+
+
 def get_git_root() -> Path:
     """Get the root directory of the git repository.
 
+    The result is cached per working directory, so repeated calls during a
+    run don't spawn a new git process each time.
+
+    Returns:
+        Path to git repository root
+
+    Raises:
+        GitError: If not in a git repository
+    """
+    return _git_root_for(os.getcwd())
+
+
+@functools.lru_cache(maxsize=8)
+def _git_root_for(cwd: str) -> Path:
+    """Resolve the git repository root for a working directory.
+
+    Args:
+        cwd: Working directory to resolve from
+
     Returns:
         Path to git repository root
 
@@ -23,6 +59,7 @@ def get_git_root() -> Path:
     try:
         result = subprocess.run(
             ["git", "rev-parse", "--show-toplevel"],
+            cwd=cwd,
             capture_output=True,
             text=True,
             check=True,
@@ -40,12 +77,18 @@ def get_git_root() -> Path:
         raise GitError("Git not found. Please ensure git is installed.")
 
 
-def _run_git_command(args: list[str], cwd: Path | str | None = None) -> str:
+def _run_git_command(
+    args: list[str],
+    cwd: Path | str | None = None,
+    error_prefix: str = "Git command failed",
+) -> str:
     """Run a git command and return output.
 
     Args:
         args: Git command arguments (e.g., ['log', '--oneline'])
         cwd: Working directory for git command (default: git repository root)
+        error_prefix: Start of the GitError message if the command fails;
+            git's stderr is appended after a colon
 
     Returns:
         Command output as string
@@ -58,20 +101,78 @@ def _run_git_command(args: list[str], cwd: Path | str | None = None) -> str:
         cwd = get_git_root()
 
     try:
+        # Read raw bytes and decode once as UTF-8, git's default output encoding
         result = subprocess.run(
             ["git"] + args,
             cwd=str(cwd),
             capture_output=True,
-            text=True,
             check=True,
         )
-        return result.stdout.strip()
+        return result.stdout.decode("utf-8", "replace").strip()
     except subprocess.CalledProcessError as e:
-        raise GitError(f"Git command failed: {e.stderr.strip()}")
+        stderr = e.stderr.decode("utf-8", "replace").strip()
+        raise GitError(f"{error_prefix}: {stderr}")
     except FileNotFoundError:
         raise GitError("Git not found. Please ensure git is installed.")
 
 
+def _iter_git_lines(
+    args: list[str], cwd: Path | str | None = None, separator: str = "\n"
+) -> Iterator[str]:
+    """Run a git command and yield its output record by record as it is produced.
+
+    Streams stdout instead of buffering the whole output, for commands
+    like 'git log' whose output grows with repository history.
+
+    Args:
+        args: Git command arguments (e.g., ['log', '--oneline'])
+        cwd: Working directory for git command (default: git repository root)
+        separator: Record separator in the output ("\\0" for commands run with -z)
+
+    Yields:
+        Output records without the separator
+
+    Raises:
+        GitError: If git command fails
+    """
+    # Default to git repository root
+    if cwd is None:
+        cwd = get_git_root()
+
+    # stderr goes to a file so git can't block on a full pipe while stdout
+    # is still being read
+    with tempfile.TemporaryFile() as stderr_file:
+        try:
+            process = subprocess.Popen(
+                ["git"] + args,
+                cwd=str(cwd),
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+            )
+        except FileNotFoundError:
+            raise GitError("Git not found. Please ensure git is installed.")
+
+        stdout = process.stdout
+        assert stdout is not None
+        # Split the raw bytes and decode each record like _run_git_command
+        sep = separator.encode()
+        with process:
+            pending = b""
+            for chunk in iter(lambda: stdout.read(65536), b""):
+                *records, pending = (pending + chunk).split(sep)
+                for record in records:
+                    yield record.decode("utf-8", "replace")
+            if pending:
+                yield pending.decode("utf-8", "replace")
+            returncode = process.wait()
+
+        stderr_file.seek(0)
+        stderr = stderr_file.read().decode("utf-8", "replace")
+
+    if returncode != 0:
+        raise GitError(f"Git command failed: {stderr.strip()}")
+
+
 def get_latest_tag(
     cwd: Path | None = None, version_prefix: str = ""
 ) -> str | None:
@@ -79,11 +180,14 @@ def get_latest_tag(
 
     Automatically fetches tags from remote to ensure up-to-date results.
     This is important for CI environments with shallow clones and local
-    development where tags may not have been pulled recently.
+    development where tags may not have been pulled recently. In a shallow
+    clone, history is deepened incrementally until a release tag is
+    reachable, so CI can check out a bounded depth.
 
-    Uses --match to filter for semver-shaped tags only, preventing
-    non-semver tags (e.g., 'v1', 'latest') from being picked up.
-    The match pattern is built from the configured version prefix.
+    Only semver-shaped tags are considered, preventing non-semver tags
+    (e.g., 'v1', 'latest') from being picked up. The match pattern is built
+    from the configured version prefix. Of the matching tags reachable from
+    HEAD, the highest version wins.
 
     Args:
         cwd: Repository directory (default: git root)
@@ -99,38 +203,107 @@ def get_latest_tag(
     if cwd is None:
         cwd = get_git_root()
 
+    shallow = _is_shallow_repository(cwd)
+
     # Fetch tags from remote to ensure we have the latest
-    # Use --tags to fetch only tags (faster than full fetch)
+    # Use --tags to fetch only tags (faster than full fetch). Shallow clones
+    # skip this: a plain tag fetch would pull in each tag's whole history,
+    # so the deepen loop below fetches tags instead.
+    if not shallow:
+        try:
+            _run_git_command(
+                ["fetch", "--tags", "--no-recurse-submodules", "origin"], cwd=cwd
+            )
+        except GitError:
+            # If fetch fails (e.g., offline, no remote, auth issues),
+            # continue with local tags - better than failing completely
+            pass
+
+    # Build match patterns to only match semver-shaped tags.
+    # This prevents non-semver tags like 'v1' or 'latest' from being picked up
+    # (e.g., GitHub Actions major version tags).
+    # We always include 'v' prefix pattern as a fallback since it's the most
+    # common convention, even if the configured prefix differs.
+    tag_patterns = [
+        f"refs/tags/{version_prefix}[0-9]*.[0-9]*.[0-9]*",
+        "refs/tags/v[0-9]*.[0-9]*.[0-9]*",
+    ]
+
+    tag = _find_latest_tag(tag_patterns, cwd)
+
+    # Shallow clone without a reachable release tag: deepen history until one
+    # turns up or the clone is complete, in which case there is no tag yet.
+    # Combined with --deepen, --tags fetches tags without their full history.
+    depth = _DEEPEN_STEP
+    while tag is None and shallow:
+        deepen_arg = f"--deepen={depth}" if depth <= _MAX_DEEPEN else "--unshallow"
+        try:
+            _run_git_command(
+                ["fetch", deepen_arg, "--tags", "--no-recurse-submodules", "origin"],
+                cwd=cwd,
+            )
+        except GitError:
+            # Offline or no remote - work with the history we have
+            break
+        depth *= 2
+        tag = _find_latest_tag(tag_patterns, cwd)
+        shallow = _is_shallow_repository(cwd)
+
+    return tag
+
+
+def _is_shallow_repository(cwd: Path | str) -> bool:
+    """Check whether the repository is a shallow clone.
+
+    git records the shallow boundary in a 'shallow' file in the common git
+    directory, so that file is checked directly when the directory can be
+    located, saving a git process.
+
+    Args:
+        cwd: Repository directory
+
+    Returns:
+        True if the repository has truncated history, False otherwise
+    """
+    git_dir = _common_git_dir(Path(cwd))
+    if git_dir is not None:
+        return (git_dir / "shallow").is_file()
+
     try:
-        subprocess.run(
-            ["git", "fetch", "--tags", "origin"],
-            cwd=str(cwd),
-            check=True,
-            capture_output=True,
-        )
-    except subprocess.CalledProcessError:
-        # If fetch fails (e.g., offline, no remote, auth issues),
-        # continue with local tags - better than failing completely
-        pass
-    except FileNotFoundError:
-        # Git not found - will fail below anyway
-        pass
+        output = _run_git_command(["rev-parse", "--is-shallow-repository"], cwd=cwd)
+    except GitError:
+        return False
+    return output == "true"
 
+
+def _find_latest_tag(tag_patterns: list[str], cwd: Path | str) -> str | None:
+    """Find the highest-versioned tag reachable from HEAD matching the given patterns.
+
+    Reads the tag refs directly instead of walking history back from HEAD
+    like 'git describe' does.
+
+    Args:
+        tag_patterns: for-each-ref glob patterns (e.g., 'refs/tags/v[0-9]*.[0-9]*.[0-9]*')
+        cwd: Repository directory
+
+    Returns:
+        Tag name or None if no matching tag is reachable
+    """
     try:
-        # Build match patterns to only match semver-shaped tags.
-        # This prevents non-semver tags like 'v1' or 'latest' from being picked up
-        # (e.g., GitHub Actions major version tags).
-        # We always include 'v' prefix pattern as a fallback since it's the most
-        # common convention, even if the configured prefix differs.
-        match_args = [
-            "--match", f"{version_prefix}[0-9]*.[0-9]*.[0-9]*",
-            "--match", "v[0-9]*.[0-9]*.[0-9]*",
-        ]
-
-        # Get the latest tag reachable from HEAD
-        # --abbrev=0 shows only the tag name without commit info
+        # --merged HEAD keeps only tags reachable from the current branch;
+        # versionsort.suffix=- sorts pre-releases (v1.2.0-rc1) before v1.2.0
         output = _run_git_command(
-            ["describe", "--tags", "--abbrev=0"] + match_args,
+            [
+                "-c",
+                "versionsort.suffix=-",
+                "for-each-ref",
+                "--merged",
+                "HEAD",
+                "--sort=-v:refname",
+                "--count=1",
+                "--format=%(refname:short)",
+            ]
+            + tag_patterns,
             cwd=cwd,
         )
         return output if output else None
@@ -160,20 +333,14 @@ def get_commits_since_tag(tag: str | None = None, cwd: Path | None = None) -> li
         # Get all commits
         range_spec = "HEAD"
 
-    try:
-        # Get commit messages only (subject line)
-        output = _run_git_command(
-            ["log", range_spec, "--pretty=format:%s"],
-            cwd=cwd,
+    # Get commit messages only (subject line), NUL-separated and streamed so
+    # the whole log is never held as one string. Raises GitError if the tag
+    # doesn't exist.
+    return list(
+        _iter_git_lines(
+            ["log", range_spec, "-z", "--pretty=format:%s"], cwd=cwd, separator="\0"
         )
-
-        if not output:
-            return []
-
-        return output.split("\n")
-    except GitError as e:
-        # If tag doesn't exist or other error, re-raise
-        raise e
+    )
 
 
 def get_latest_commit_message(cwd: Path | None = None) -> str:
@@ -203,9 +370,7 @@ def extract_version_from_tag(tag: str) -> str:
     Returns:
         Version string without prefix (e.g., '1.2.3')
     """
-    # Remove common prefixes like 'v', 'version-', etc.
-    version = re.sub(r"^(v|version-?)", "", tag, flags=re.IGNORECASE)
-    return version
+    return _TAG_PREFIX_RE.sub("", tag)
 
 
 def get_current_branch(git_root: Path) -> str:
@@ -220,20 +385,14 @@ def get_current_branch(git_root: Path) -> str:
     Raises:
         GitError: If unable to determine current branch
     """
-    try:
-        result = subprocess.run(
-            ["git", "branch", "--show-current"],
-            cwd=git_root,
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        branch = result.stdout.strip()
-        if not branch:
-            raise GitError("Unable to determine current branch (detached HEAD?)")
-        return branch
-    except subprocess.CalledProcessError as e:
-        raise GitError(f"Failed to get current branch: {e.stderr.decode().strip()}")
+    branch = _run_git_command(
+        ["branch", "--show-current"],
+        cwd=git_root,
+        error_prefix="Failed to get current branch",
+    )
+    if not branch:
+        raise GitError("Unable to determine current branch (detached HEAD?)")
+    return branch
 
 
 def tag_exists(tag_name: str, git_root: Path) -> bool:
@@ -246,29 +405,114 @@ def tag_exists(tag_name: str, git_root: Path) -> bool:
     Returns:
         True if tag exists, False otherwise
     """
-    try:
-        # Check if tag exists locally
-        result = subprocess.run(
-            ["git", "rev-parse", "--verify", f"refs/tags/{tag_name}"],
-            cwd=git_root,
-            capture_output=True,
-            check=False,
-        )
-        if result.returncode == 0:
+    # Check if tag exists locally, reading the ref files when we can
+    local_tags = _local_tags(git_root)
+    if local_tags is not None:
+        if tag_name in local_tags:
+            return True
+    else:
+        try:
+            _run_git_command(
+                ["rev-parse", "--verify", f"refs/tags/{tag_name}"], cwd=git_root
+            )
             return True
+        except GitError:
+            pass
 
-        # Check if tag exists remotely
-        result = subprocess.run(
-            ["git", "ls-remote", "--tags", "origin", tag_name],
-            cwd=git_root,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        return bool(result.stdout.strip())
+    # Check if tag exists remotely
+    return tag_name in _remote_tags(git_root)
 
-    except subprocess.SubprocessError:
-        return False
+
+def _common_git_dir(git_root: Path) -> Path | None:
+    """Locate the git directory holding a repository's refs and config.
+
+    Worktrees and submodules (where .git is a file) are followed to the
+    common git directory.
+
+    Args:
+        git_root: Git repository root path
+
+    Returns:
+        Common git directory, or None if it can't be located
+    """
+    git_dir = git_root / ".git"
+    try:
+        if git_dir.is_file():
+            gitdir_line = git_dir.read_text().strip()
+            if not gitdir_line.startswith("gitdir:"):
+                return None
+            git_dir = git_root / gitdir_line.removeprefix("gitdir:").strip()
+        commondir = git_dir / "commondir"
+        if commondir.is_file():
+            git_dir = git_dir / commondir.read_text().strip()
+    except OSError:
+        return None
+
+    return git_dir if git_dir.is_dir() else None
+
+
+def _local_tags(git_root: Path) -> frozenset[str] | None:
+    """List local tags by reading loose refs and packed-refs directly.
+
+    Avoids spawning git for a lookup that only needs the ref files.
+
+    Args:
+        git_root: Git repository root path
+
+    Returns:
+        Set of local tag names, or None if the ref storage isn't the
+        files backend (e.g., reftable) and git must be asked instead
+    """
+    git_dir = _common_git_dir(git_root)
+    if git_dir is None or (git_dir / "reftable").exists():
+        return None
+
+    tags = set()
+    tags_dir = git_dir / "refs" / "tags"
+    if tags_dir.is_dir():
+        for path in tags_dir.rglob("*"):
+            if path.is_file() and path.suffix != ".lock":
+                tags.add(path.relative_to(tags_dir).as_posix())
+
+    try:
+        packed_refs = (git_dir / "packed-refs").read_text()
+    except FileNotFoundError:
+        packed_refs = ""
+    for line in packed_refs.splitlines():
+        # "<sha> refs/tags/<name>"; skip the header and "^<sha>" peeled lines
+        if line.startswith(("#", "^")):
+            continue
+        ref = line.partition(" ")[2]
+        if ref.startswith("refs/tags/"):
+            tags.add(ref.removeprefix("refs/tags/"))
+
+    return frozenset(tags)
+
+
+@functools.lru_cache(maxsize=8)
+def _remote_tags(git_root: Path) -> frozenset[str]:
+    """List the tags on remote origin, fetched once and cached.
+
+    The cache is cleared whenever this module pushes a tag.
+
+    Args:
+        git_root: Git repository root path
+
+    Returns:
+        Set of remote tag names (empty if the remote can't be reached)
+    """
+    try:
+        output = _run_git_command(["ls-remote", "--tags", "origin"], cwd=git_root)
+    except GitError:
+        return frozenset()
+
+    tags = set()
+    for line in output.splitlines():
+        # "<sha>\trefs/tags/<name>", plus "<name>^{}" lines for peeled annotated tags
+        ref = line.partition("\t")[2]
+        if ref.startswith("refs/tags/"):
+            tags.add(ref.removeprefix("refs/tags/").removesuffix("^{}"))
+    return frozenset(tags)
 
 
 def create_tag(tag_name: str, message: str, git_root: Path) -> None:
@@ -282,16 +526,11 @@ def create_tag(tag_name: str, message: str, git_root: Path) -> None:
     Raises:
         GitError: If tag creation fails
     """
-    try:
-        subprocess.run(
-            ["git", "tag", "-a", tag_name, "-m", message],
-            cwd=git_root,
-            check=True,
-            capture_output=True,
-        )
-    except subprocess.CalledProcessError as e:
-        stderr = e.stderr.decode().strip() if e.stderr else ""
-        raise GitError(f"Failed to create tag '{tag_name}': {stderr}")
+    _run_git_command(
+        ["tag", "-a", tag_name, "-m", message],
+        cwd=git_root,
+        error_prefix=f"Failed to create tag '{tag_name}'",
+    )
 
 
 def create_lightweight_tag(tag_name: str, target: str, git_root: Path) -> None:
@@ -308,16 +547,11 @@ def create_lightweight_tag(tag_name: str, target: str, git_root: Path) -> None:
     Raises:
         GitError: If tag creation fails
     """
-    try:
-        subprocess.run(
-            ["git", "tag", "-f", tag_name, target],
-            cwd=git_root,
-            check=True,
-            capture_output=True,
-        )
-    except subprocess.CalledProcessError as e:
-        stderr = e.stderr.decode().strip() if e.stderr else ""
-        raise GitError(f"Failed to create lightweight tag '{tag_name}': {stderr}")
+    _run_git_command(
+        ["tag", "-f", tag_name, target],
+        cwd=git_root,
+        error_prefix=f"Failed to create lightweight tag '{tag_name}'",
+    )
 
 
 def force_push_tag(tag_name: str, git_root: Path) -> None:
@@ -330,16 +564,12 @@ def force_push_tag(tag_name: str, git_root: Path) -> None:
     Raises:
         GitError: If tag push fails
     """
-    try:
-        subprocess.run(
-            ["git", "push", "-f", "origin", tag_name],
-            cwd=git_root,
-            check=True,
-            capture_output=True,
-        )
-    except subprocess.CalledProcessError as e:
-        stderr = e.stderr.decode().strip() if e.stderr else ""
-        raise GitError(f"Failed to force-push tag '{tag_name}': {stderr}")
+    _run_git_command(
+        ["push", "-f", "origin", tag_name],
+        cwd=git_root,
+        error_prefix=f"Failed to force-push tag '{tag_name}'",
+    )
+    _remote_tags.cache_clear()
 
 
 def push_tag(tag_name: str, git_root: Path) -> None:
@@ -352,16 +582,12 @@ def push_tag(tag_name: str, git_root: Path) -> None:
     Raises:
         GitError: If tag push fails
     """
-    try:
-        subprocess.run(
-            ["git", "push", "origin", tag_name],
-            cwd=git_root,
-            check=True,
-            capture_output=True,
-        )
-    except subprocess.CalledProcessError as e:
-        stderr = e.stderr.decode().strip() if e.stderr else ""
-        raise GitError(f"Failed to push tag '{tag_name}': {stderr}")
+    _run_git_command(
+        ["push", "origin", tag_name],
+        cwd=git_root,
+        error_prefix=f"Failed to push tag '{tag_name}'",
+    )
+    _remote_tags.cache_clear()
 
 
 def checkout_branch(branch_name: str, git_root: Path) -> None:
@@ -374,16 +600,11 @@ def checkout_branch(branch_name: str, git_root: Path) -> None:
     Raises:
         GitError: If checkout fails
     """
-    try:
-        subprocess.run(
-            ["git", "checkout", branch_name],
-            cwd=git_root,
-            check=True,
-            capture_output=True,
-        )
-    except subprocess.CalledProcessError as e:
-        stderr = e.stderr.decode().strip() if e.stderr else ""
-        raise GitError(f"Failed to checkout branch '{branch_name}': {stderr}")
+    _run_git_command(
+        ["checkout", branch_name],
+        cwd=git_root,
+        error_prefix=f"Failed to checkout branch '{branch_name}'",
+    )
 
 
 def configure_git_identity(user_name: str, user_email: str, git_root: Path) -> None:
@@ -397,22 +618,111 @@ def configure_git_identity(user_name: str, user_email: str, git_root: Path) -> N
     Raises:
         GitError: If git configuration fails
     """
+    error_prefix = "Failed to configure git identity"
+    _run_git_command(
+        ["config", "user.name", user_name], cwd=git_root, error_prefix=error_prefix
+    )
+    _run_git_command(
+        ["config", "user.email", user_email], cwd=git_root, error_prefix=error_prefix
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def get_remote_url(git_root: Path, remote: str = "origin") -> str:
+    """Get the URL of a git remote, cached per repository and remote.
+
+    Host detection and repo-info parsing both need the origin URL, so it is
+    read once per run, from the repository config file when possible and
+    from git otherwise.
+
+    Args:
+        git_root: Git repository root path
+        remote: Remote name (default: 'origin')
+
+    Returns:
+        Remote URL
+
+    Raises:
+        GitError: If the remote doesn't exist or git fails
+    """
     try:
-        subprocess.run(
-            ["git", "config", "user.name", user_name],
-            cwd=git_root,
-            check=True,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.email", user_email],
-            cwd=git_root,
-            check=True,
-            capture_output=True,
-        )
-    except subprocess.CalledProcessError as e:
-        stderr = e.stderr.decode().strip() if e.stderr else ""
-        raise GitError(f"Failed to configure git identity: {stderr}")
+        url = _config_remote_url(git_root, remote)
+    except Exception:
+        # Anything unexpected (unparsable config, no home directory, ...)
+        # is left to git
+        url = None
+    if url:
+        return url
+    return _run_git_command(["remote", "get-url", remote], cwd=git_root)
+
+
+def _config_remote_url(git_root: Path, remote: str) -> str | None:
+    """Read a remote's URL straight from the repository's config file.
+
+    Saves spawning git for a single config value. Only the plain case is
+    handled here: git is asked instead when git's environment variables
+    point at another repository or config, when any config file git reads
+    has includes or URL rewrites (or, outside the repository, remotes), or
+    when the URL is repeated, quoted or escaped.
+
+    Args:
+        git_root: Git repository root path
+        remote: Remote name
+
+    Returns:
+        Remote URL, or None if git must be asked instead
+
+    Raises:
+        configparser.Error: If a config file can't be parsed
+        RuntimeError: If the home directory can't be determined
+    """
+    if any(
+        name in ("GIT_DIR", "GIT_COMMON_DIR") or name.startswith("GIT_CONFIG")
+        for name in os.environ
+    ):
+        return None
+
+    git_dir = _common_git_dir(git_root)
+    if git_dir is None:
+        return None
+
+    xdg_home = os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config"
+    user_config = configparser.ConfigParser(
+        strict=False, allow_no_value=True, interpolation=None
+    )
+    user_config.read(
+        [
+            "/etc/gitconfig",
+            Path(xdg_home) / "git" / "config",
+            Path.home() / ".gitconfig",
+        ],
+        encoding="utf-8",
+    )
+    if any(
+        section.lower().startswith((*_URL_CONFIG_SECTIONS, "remote "))
+        for section in user_config.sections()
+    ):
+        return None
+
+    # strict rejects a remote with several URLs, where git uses the first
+    repo_config = configparser.ConfigParser(
+        delimiters=("=",),
+        inline_comment_prefixes=("#", ";"),
+        allow_no_value=True,
+        interpolation=None,
+    )
+    if not repo_config.read(git_dir / "config", encoding="utf-8"):
+        return None
+    if any(
+        section.lower().startswith(_URL_CONFIG_SECTIONS)
+        for section in repo_config.sections()
+    ):
+        return None
+
+    url = repo_config.get(f'remote "{remote}"', "url", fallback=None)
+    if not url or any(char in url for char in '"\\#;'):
+        return None
+    return url
 
 
 def detect_git_host(git_root: Path) -> str | None:
@@ -425,14 +735,7 @@ def detect_git_host(git_root: Path) -> str | None:
         Git host identifier ('github', 'azure', 'gitlab') or None if cannot detect
     """
     try:
-        result = subprocess.run(
-            ["git", "remote", "get-url", "origin"],
-            cwd=git_root,
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        remote_url = result.stdout.strip().lower()
+        remote_url = get_remote_url(git_root).lower()
 
         # Check for GitHub
         if "github.com" in remote_url:
@@ -448,5 +751,5 @@ def detect_git_host(git_root: Path) -> str | None:
 
         return None
 
-    except subprocess.CalledProcessError:
+    except GitError:
         return None
@@ -1,19 +1,65 @@
 """GitHub API integration for pull request creation."""
 
-import json
 import os
 import re
-import subprocess
 from pathlib import Path
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from contiamo_release_please.git import GitError, get_remote_url
 
 
 class GitHubError(Exception):
     """Raised when GitHub API operations fail."""
 
 
+# Remote URL formats, matched in one pass:
+# - https://github.com/owner/repo(.git)
+# - git@github.com:owner/repo(.git)
+# - ssh://git@github.com/owner/repo(.git)
+_REMOTE_URL_RE = re.compile(
+    r"^(?:https://github\.com/|git@github\.com:|ssh://git@github\.com/)"
+    r"([^/]+)/(.+?)(?:\.git)?/?$"
+)
+
+_session: requests.Session | None = None
+
+# Last ETag and PR number seen per (owner, repo, head, base) PR lookup
+_PR_LOOKUP_ETAGS: dict[tuple[str, str, str, str], tuple[str, int | None]] = {}
+
+
+def _get_session() -> requests.Session:
+    """Get the shared HTTP session for GitHub API calls.
+
+    Reusing one session keeps the connection to api.github.com alive across
+    the find/create/update calls of a release. Transient gateway errors are
+    retried for idempotent methods only, so PRs and releases are never
+    created twice.
+
+    Returns:
+        Shared requests session
+    """
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        _session.headers.update(
+            {
+                "Accept": "application/vnd.github.v3+json",
+                "User-Agent": "contiamo-release-please",
+            }
+        )
+        retry = Retry(
+            total=3,
+            status_forcelist=(502, 503, 504),
+            backoff_factor=0.3,
+        )
+        _session.mount("https://", HTTPAdapter(max_retries=retry))
+    return _session
+
+
 def get_github_token(config: dict[str, Any]) -> str:
     """Get GitHub token from environment or config.
 
@@ -57,37 +103,17 @@ def get_repo_info(git_root: Path) -> tuple[str, str]:
         GitHubError: If remote URL cannot be parsed
     """
     try:
-        result = subprocess.run(
-            ["git", "remote", "get-url", "origin"],
-            cwd=git_root,
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        remote_url = result.stdout.strip()
-
-        # Parse different URL formats:
-        # - https://github.com/owner/repo.git
-        # - git@github.com:owner/repo.git
-        # - https://github.com/owner/repo
+        remote_url = get_remote_url(git_root)
 
-        # HTTPS format
-        https_match = re.match(
-            r"https://github\.com/([^/]+)/(.+?)(?:\.git)?$", remote_url
-        )
-        if https_match:
-            return https_match.group(1), https_match.group(2)
-
-        # SSH format
-        ssh_match = re.match(r"git@github\.com:([^/]+)/(.+?)(?:\.git)?$", remote_url)
-        if ssh_match:
-            return ssh_match.group(1), ssh_match.group(2)
+        match = _REMOTE_URL_RE.match(remote_url)
+        if match:
+            return match.group(1), match.group(2)
 
         raise GitHubError(
             f"Could not parse GitHub owner/repo from remote URL: {remote_url}"
         )
 
-    except subprocess.CalledProcessError as e:
+    except GitError as e:
         raise GitHubError(f"Failed to get git remote URL: {e}")
 
 
@@ -100,6 +126,9 @@ def find_existing_pr(
 ) -> int | None:
     """Find existing PR by head and base branches.
 
+    Repeated lookups in the same process send the previous ETag, so an
+    unchanged result comes back as 304 Not Modified without a body.
+
     Args:
         owner: Repository owner
         repo: Repository name
@@ -116,7 +145,6 @@ def find_existing_pr(
     url = f"https://api.github.com/repos/{owner}/{repo}/pulls"
     headers = {
         "Authorization": f"token {token}",
-        "Accept": "application/vnd.github.v3+json",
     }
     params = {
         "state": "open",
@@ -124,15 +152,25 @@ def find_existing_pr(
         "base": base_branch,
     }
 
+    cache_key = (owner, repo, head_branch, base_branch)
+    cached = _PR_LOOKUP_ETAGS.get(cache_key)
+    if cached:
+        headers["If-None-Match"] = cached[0]
+
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=30)
+        response = _get_session().get(url, headers=headers, params=params, timeout=30)
+        if cached and response.status_code == 304:
+            return cached[1]
         response.raise_for_status()
 
         prs = response.json()
-        if prs and len(prs) > 0:
-            return prs[0]["number"]
+        pr_number = prs[0]["number"] if prs else None
 
-        return None
+        etag = response.headers.get("ETag")
+        if etag:
+            _PR_LOOKUP_ETAGS[cache_key] = (etag, pr_number)
+
+        return pr_number
 
     except requests.exceptions.RequestException as e:
         raise GitHubError(f"Failed to check for existing PR: {e}")
@@ -167,8 +205,6 @@ def create_pull_request(
     url = f"https://api.github.com/repos/{owner}/{repo}/pulls"
     headers = {
         "Authorization": f"token {token}",
-        "Accept": "application/vnd.github.v3+json",
-        "Content-Type": "application/json",
     }
     payload = {
         "title": title,
@@ -178,10 +214,10 @@ def create_pull_request(
     }
 
     try:
-        response = requests.post(
+        response = _get_session().post(
             url,
             headers=headers,
-            data=json.dumps(payload),
+            json=payload,
             timeout=30,
         )
         response.raise_for_status()
@@ -226,8 +262,6 @@ def update_pull_request(
     url = f"https://api.github.com/repos/{owner}/{repo}/pulls/{pr_number}"
     headers = {
         "Authorization": f"token {token}",
-        "Accept": "application/vnd.github.v3+json",
-        "Content-Type": "application/json",
     }
     payload = {
         "title": title,
@@ -235,10 +269,10 @@ def update_pull_request(
     }
 
     try:
-        response = requests.patch(
+        response = _get_session().patch(
             url,
             headers=headers,
-            data=json.dumps(payload),
+            json=payload,
             timeout=30,
         )
         response.raise_for_status()
@@ -290,8 +324,6 @@ def create_github_release(
     url = f"https://api.github.com/repos/{owner}/{repo}/releases"
     headers = {
         "Authorization": f"token {token}",
-        "Accept": "application/vnd.github.v3+json",
-        "Content-Type": "application/json",
     }
     payload = {
         "tag_name": tag_name,
@@ -305,10 +337,10 @@ def create_github_release(
         if verbose:
             print(f"Creating GitHub release for tag {tag_name}")
 
-        response = requests.post(
+        response = _get_session().post(
             url,
             headers=headers,
-            data=json.dumps(payload),
+            json=payload,
             timeout=30,
         )
         response.raise_for_status()
@@ -359,6 +391,12 @@ def create_or_update_pr(
     if dry_run:
         return None
 
+    # GitHub rejects a PR whose head is its base; fail before any API call
+    if head_branch == base_branch:
+        raise GitHubError(
+            f"Cannot create pull request: head and base branch are both '{head_branch}'"
+        )
+
     # Check if PR already exists
     existing_pr = find_existing_pr(owner, repo, head_branch, base_branch, token)
 
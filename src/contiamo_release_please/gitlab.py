@@ -1,20 +1,113 @@
 """GitLab API integration for merge request creation."""
 
-import json
+import functools
 import os
 import re
-import subprocess
 from pathlib import Path
 from typing import Any
 from urllib.parse import quote_plus
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from contiamo_release_please.git import GitError, get_remote_url
 
 
 class GitLabError(Exception):
     """Raised when GitLab API operations fail."""
 
 
+class MergeRequestExistsError(GitLabError):
+    """Raised when an open MR already exists for the source/target branches."""
+
+    def __init__(self, message: str, mr_iid: int | None = None):
+        super().__init__(message)
+        self.mr_iid = mr_iid
+
+
+# Remote URL formats:
+# - https://gitlab.com/owner/repo.git
+# - https://gitlab.devops.telekom.de/org/subgroup/project.git
+# - git@gitlab.com:owner/repo.git
+# - git@gitlab.devops.telekom.de:org/subgroup/project.git
+_HTTPS_REMOTE_RE = re.compile(r"https://([^/]+)/(.+?)(?:\.git)?$")
+_SSH_REMOTE_RE = re.compile(r"git@([^:]+):(.+?)(?:\.git)?$")
+
+# GitLab's 409 message names the conflicting MR, e.g. "...source branch: !42"
+_EXISTING_MR_RE = re.compile(r"!(\d+)")
+
+
+class _GitLabRetry(Retry):
+    """Retry policy that only retries POSTs when GitLab rate-limits them.
+
+    A 502/504 from a gateway can arrive after GitLab has already created the
+    MR or release, so retrying the POST would fail with 409 even though the
+    request succeeded. A 429 is rejected before any work is done, which makes
+    it the one status a POST is safe to retry on.
+    """
+
+    def is_retry(
+        self, method: str, status_code: int, has_retry_after: bool = False
+    ) -> bool:
+        if method.upper() == "POST" and status_code == 429:
+            return True
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+_session: requests.Session | None = None
+
+
+def _get_session() -> requests.Session:
+    """Get the shared HTTP session for GitLab API calls.
+
+    Reusing one session keeps the connection to the GitLab host alive across
+    the find/create/update calls of a release. Rate limiting and transient
+    gateway errors are retried with backoff, honouring Retry-After. Only
+    idempotent methods are retried on gateway errors; POSTs are retried on
+    429 alone.
+
+    Returns:
+        Shared requests session
+    """
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        retry = _GitLabRetry(
+            total=5,
+            status_forcelist=(429, 502, 503, 504),
+            backoff_factor=0.5,
+        )
+        _session.mount("https://", HTTPAdapter(max_retries=retry))
+    return _session
+
+
+def _api_error_message(action: str, error: requests.exceptions.RequestException) -> str:
+    """Build an error message for a failed GitLab API request.
+
+    Args:
+        action: What was attempted (e.g., 'create merge request')
+        error: The request exception
+
+    Returns:
+        Error message, including GitLab's own message when the response has one
+    """
+    error_msg = f"Failed to {action}: {error}"
+    response = error.response
+    if response is None:
+        return error_msg
+
+    # Only decode JSON error bodies, not proxy HTML error pages
+    if response.headers.get("Content-Type", "").startswith("application/json"):
+        try:
+            error_data = response.json()
+            if "message" in error_data:
+                error_msg = f"{error_msg} - {error_data['message']}"
+        except Exception:
+            pass
+    return error_msg
+
+
 def get_gitlab_token(config: dict[str, Any]) -> str:
     """Get GitLab token from environment or config.
 
@@ -61,48 +154,25 @@ def get_gitlab_repo_info(git_root: Path) -> tuple[str, str]:
         GitLabError: If remote URL cannot be parsed
     """
     try:
-        result = subprocess.run(
-            ["git", "remote", "get-url", "origin"],
-            cwd=git_root,
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        remote_url = result.stdout.strip()
-
-        # Parse different URL formats:
-        # - https://gitlab.com/owner/repo.git
-        # - https://gitlab.devops.telekom.de/org/subgroup/project.git
-        # - git@gitlab.com:owner/repo.git
-        # - git@gitlab.devops.telekom.de:org/subgroup/project.git
-
-        # HTTPS format
-        https_match = re.match(r"https://([^/]+)/(.+?)(?:\.git)?$", remote_url)
-        if https_match:
-            host = https_match.group(1)
-            project_path = https_match.group(2)
-            # Validate it's actually GitLab
-            if "gitlab" in host.lower():
-                return host, project_path
-
-        # SSH format
-        ssh_match = re.match(r"git@([^:]+):(.+?)(?:\.git)?$", remote_url)
-        if ssh_match:
-            host = ssh_match.group(1)
-            project_path = ssh_match.group(2)
-            # Validate it's actually GitLab
-            if "gitlab" in host.lower():
-                return host, project_path
-
-        raise GitLabError(
-            f"Could not parse GitLab host/project from remote URL: {remote_url}. "
-            f"Expected GitLab URL format (e.g., https://gitlab.com/owner/repo.git)"
-        )
-
-    except subprocess.CalledProcessError as e:
+        remote_url = get_remote_url(git_root)
+    except GitError as e:
         raise GitLabError(f"Failed to get git remote URL: {e}")
 
+    # HTTPS format first, then SSH
+    match = _HTTPS_REMOTE_RE.match(remote_url) or _SSH_REMOTE_RE.match(remote_url)
+    if match:
+        host, project_path = match.groups()
+        # Validate it's actually GitLab
+        if "gitlab" in host.lower():
+            return host, project_path
 
+    raise GitLabError(
+        f"Could not parse GitLab host/project from remote URL: {remote_url}. "
+        f"Expected GitLab URL format (e.g., https://gitlab.com/owner/repo.git)"
+    )
+
+
+@functools.lru_cache(maxsize=32)
 def get_project_id(host: str, project_path: str) -> str:
     """Get URL-encoded project ID for GitLab API.
 
@@ -119,6 +189,23 @@ def get_project_id(host: str, project_path: str) -> str:
     return quote_plus(project_path)
 
 
+def _build_mr_url(host: str, project_path: str, mr_iid: int | None = None) -> str:
+    """Build the merge requests API URL for a project.
+
+    Args:
+        host: GitLab host
+        project_path: Project path
+        mr_iid: Merge request IID, for the URL of a single MR
+
+    Returns:
+        API URL of the project's merge requests, or of one MR if mr_iid is given
+    """
+    url = f"https://{host}/api/v4/projects/{get_project_id(host, project_path)}"
+    if mr_iid is None:
+        return f"{url}/merge_requests"
+    return f"{url}/merge_requests/{mr_iid}"
+
+
 def find_existing_pr(
     host: str,
     project_path: str,
@@ -141,11 +228,9 @@ def find_existing_pr(
     Raises:
         GitLabError: If API request fails
     """
-    project_id = get_project_id(host, project_path)
-    url = f"https://{host}/api/v4/projects/{project_id}/merge_requests"
+    url = _build_mr_url(host, project_path)
     headers = {
         "PRIVATE-TOKEN": token,
-        "Content-Type": "application/json",
     }
     params = {
         "state": "opened",
@@ -154,7 +239,7 @@ def find_existing_pr(
     }
 
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=30)
+        response = _get_session().get(url, headers=headers, params=params, timeout=30)
         response.raise_for_status()
 
         mrs = response.json()
@@ -191,13 +276,12 @@ def create_pull_request(
         MR data from GitLab API
 
     Raises:
+        MergeRequestExistsError: If an open MR already exists for the branches
         GitLabError: If MR creation fails
     """
-    project_id = get_project_id(host, project_path)
-    url = f"https://{host}/api/v4/projects/{project_id}/merge_requests"
+    url = _build_mr_url(host, project_path)
     headers = {
         "PRIVATE-TOKEN": token,
-        "Content-Type": "application/json",
     }
     payload = {
         "source_branch": source_branch,
@@ -207,24 +291,22 @@ def create_pull_request(
     }
 
     try:
-        response = requests.post(
+        response = _get_session().post(
             url,
             headers=headers,
-            data=json.dumps(payload),
+            json=payload,
             timeout=30,
         )
         response.raise_for_status()
         return response.json()
 
     except requests.exceptions.RequestException as e:
-        error_msg = f"Failed to create merge request: {e}"
-        if hasattr(e, "response") and e.response is not None:
-            try:
-                error_data = e.response.json()
-                if "message" in error_data:
-                    error_msg += f" - {error_data['message']}"
-            except Exception:
-                pass
+        error_msg = _api_error_message("create merge request", e)
+        if e.response is not None and e.response.status_code == 409:
+            match = _EXISTING_MR_RE.search(error_msg)
+            raise MergeRequestExistsError(
+                error_msg, int(match.group(1)) if match else None
+            )
         raise GitLabError(error_msg)
 
 
@@ -252,11 +334,9 @@ def update_pull_request(
     Raises:
         GitLabError: If MR update fails
     """
-    project_id = get_project_id(host, project_path)
-    url = f"https://{host}/api/v4/projects/{project_id}/merge_requests/{mr_iid}"
+    url = _build_mr_url(host, project_path, mr_iid)
     headers = {
         "PRIVATE-TOKEN": token,
-        "Content-Type": "application/json",
     }
     payload = {
         "title": title,
@@ -264,25 +344,17 @@ def update_pull_request(
     }
 
     try:
-        response = requests.put(
+        response = _get_session().put(
             url,
             headers=headers,
-            data=json.dumps(payload),
+            json=payload,
             timeout=30,
         )
         response.raise_for_status()
         return response.json()
 
     except requests.exceptions.RequestException as e:
-        error_msg = f"Failed to update merge request: {e}"
-        if hasattr(e, "response") and e.response is not None:
-            try:
-                error_data = e.response.json()
-                if "message" in error_data:
-                    error_msg += f" - {error_data['message']}"
-            except Exception:
-                pass
-        raise GitLabError(error_msg)
+        raise GitLabError(_api_error_message("update merge request", e))
 
 
 def create_gitlab_release(
@@ -320,7 +392,6 @@ def create_gitlab_release(
     url = f"https://{host}/api/v4/projects/{project_id}/releases"
     headers = {
         "PRIVATE-TOKEN": token,
-        "Content-Type": "application/json",
     }
     payload = {
         "tag_name": tag_name,
@@ -332,25 +403,17 @@ def create_gitlab_release(
         if verbose:
             print(f"Creating GitLab release for tag {tag_name}")
 
-        response = requests.post(
+        response = _get_session().post(
             url,
             headers=headers,
-            data=json.dumps(payload),
+            json=payload,
             timeout=30,
         )
         response.raise_for_status()
         return response.json()
 
     except requests.exceptions.RequestException as e:
-        error_msg = f"Failed to create GitLab release: {e}"
-        if hasattr(e, "response") and e.response is not None:
-            try:
-                error_data = e.response.json()
-                if "message" in error_data:
-                    error_msg += f" - {error_data['message']}"
-            except Exception:
-                pass
-        raise GitLabError(error_msg)
+        raise GitLabError(_api_error_message("create GitLab release", e))
 
 
 def create_or_update_pr(
@@ -366,6 +429,9 @@ def create_or_update_pr(
 ) -> dict[str, Any] | None:
     """Create a new MR or update existing one.
 
+    Creation is attempted first, so a new MR costs a single API call. Only
+    when GitLab rejects it because an MR already exists is that MR updated.
+
     Args:
         host: GitLab host
         project_path: Project path
@@ -386,16 +452,21 @@ def create_or_update_pr(
     if dry_run:
         return None
 
-    # Check if MR already exists
-    existing_mr = find_existing_pr(host, project_path, head_branch, base_branch, token)
-
-    if existing_mr:
-        if verbose:
-            print(f"Updating existing MR !{existing_mr}")
-        return update_pull_request(host, project_path, existing_mr, title, body, token)
-    else:
-        if verbose:
-            print(f"Creating new MR from {head_branch} to {base_branch}")
-        return create_pull_request(
+    try:
+        mr_data = create_pull_request(
             host, project_path, title, body, head_branch, base_branch, token
         )
+        if verbose:
+            print(f"Created new MR from {head_branch} to {base_branch}")
+        return mr_data
+    except MergeRequestExistsError as e:
+        # Fall back to looking the MR up if the conflict message didn't name it
+        existing_mr = e.mr_iid or find_existing_pr(
+            host, project_path, head_branch, base_branch, token
+        )
+        if not existing_mr:
+            raise
+
+    if verbose:
+        print(f"Updating existing MR !{existing_mr}")
+    return update_pull_request(host, project_path, existing_mr, title, body, token)
@@ -1,39 +1,17 @@
 """CLI interface for contiamo-release-please."""
 
+import functools
 import sys
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
 import click
 
 from contiamo_release_please import __version__
-from contiamo_release_please.analyser import analyse_commits, get_commit_type_summary
-from contiamo_release_please.bumper import FileBumperError, bump_files
-from contiamo_release_please.changelog import (
-    format_changelog_entry,
-    group_commits_by_section,
-    prepend_to_changelog,
-)
-from contiamo_release_please.config import ConfigError, load_config
-from contiamo_release_please.git import (
-    GitError,
-    extract_version_from_tag,
-    get_commits_since_tag,
-    get_git_root,
-    get_latest_tag,
-)
-from contiamo_release_please.release import (
-    ReleaseError,
-    create_release_branch_workflow,
-    tag_release_workflow,
-)
-from contiamo_release_please.version import FIRST_RELEASE, get_next_version
-
 
-def add_help_option(f):
-    """Custom decorator to add '-h' as an alias for '--help'."""
-    f = click.help_option("--help", "-h")(f)
-    return f
+# Command modules are imported inside the commands that use them, so that
+# --help, completion and the other lightweight commands start quickly
 
 
 def calculate_next_version(config_path: str | None = None) -> dict[str, Any]:
@@ -50,11 +28,22 @@ def calculate_next_version(config_path: str | None = None) -> dict[str, Any]:
         - release_type: Release type ('major', 'minor', 'patch') or None
         - commits: List of commit messages analysed
         - commit_summary: Dictionary of commit type counts
+        - config: The loaded ReleaseConfig
 
     Raises:
         ConfigError: If configuration is invalid
         GitError: If git operations fail
     """
+    from contiamo_release_please.analyser import analyse
+    from contiamo_release_please.config import load_config
+    from contiamo_release_please.git import (
+        extract_version_from_tag,
+        get_commits_since_tag,
+        get_git_root,
+        get_latest_tag,
+    )
+    from contiamo_release_please.version import get_next_version
+
     # If no config specified, use git root + default filename
     if config_path is None:
         git_root = get_git_root()
@@ -75,11 +64,8 @@ def calculate_next_version(config_path: str | None = None) -> dict[str, Any]:
     # Get commits since tag
     commits = get_commits_since_tag(latest_tag)
 
-    # Get commit summary
-    commit_summary = get_commit_type_summary(commits, release_config)
-
-    # Analyse commits to determine release type
-    release_type = analyse_commits(commits, release_config)
+    # Analyse commits to determine release type and commit summary
+    release_type, commit_summary = analyse(commits, release_config)
 
     # Calculate next version
     next_version = get_next_version(current_version, release_type)
@@ -94,11 +80,67 @@ def calculate_next_version(config_path: str | None = None) -> dict[str, Any]:
         "release_type": release_type,
         "commits": commits,
         "commit_summary": commit_summary,
+        "config": release_config,
     }
 
 
-@click.group()
-@add_help_option
+def _error_prefix(error: Exception) -> str | None:
+    """Get the message prefix for an error raised by a command.
+
+    The error classes are imported here rather than at module level; by the
+    time a command fails, their modules have normally been loaded already.
+
+    Args:
+        error: Exception raised by the command
+
+    Returns:
+        Message prefix (e.g., 'Git error'), or None for other exceptions
+    """
+    from contiamo_release_please.bumper import FileBumperError
+    from contiamo_release_please.config import ConfigError
+    from contiamo_release_please.git import GitError
+    from contiamo_release_please.release import ReleaseError
+
+    if isinstance(error, ConfigError):
+        return "Configuration error"
+    if isinstance(error, GitError):
+        return "Git error"
+    if isinstance(error, ReleaseError):
+        return "Release error"
+    if isinstance(error, FileBumperError):
+        return "Bumper error"
+    return None
+
+
+def _exit_on_error(catch_all: bool = True) -> Callable[[Callable], Callable]:
+    """Report errors raised by a command on stderr and exit with status 1.
+
+    Args:
+        catch_all: If False, only this package's errors are reported and any
+            other exception propagates
+
+    Returns:
+        Decorator for a command function
+    """
+
+    def decorator(f: Callable) -> Callable:
+        @functools.wraps(f)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return f(*args, **kwargs)
+            except Exception as e:
+                prefix = _error_prefix(e)
+                if prefix is None and not catch_all:
+                    raise
+                click.echo(f"{prefix or 'Error'}: {e}", err=True)
+                sys.exit(1)
+
+        return wrapper
+
+    return decorator
+
+
+@click.group(context_settings={"help_option_names": ["-h", "--help"]})
 @click.version_option(__version__, "--version", "-v")
 def cli():
     """Contiamo Release Please - Automated semantic versioning and release management."""
@@ -106,7 +148,6 @@ def cli():
 
 
 @cli.command()
-@add_help_option
 @click.option(
     "--config",
     "-c",
@@ -119,80 +160,68 @@ def cli():
     is_flag=True,
     help="Show detailed information about commits analysed",
 )
+@_exit_on_error()
 def next_version(config: str | None, verbose: bool):
     """Calculate the next semantic version based on commit history.
 
     Analyses commits since the last git tag and determines what version
     bump is needed based on conventional commit types.
     """
-    try:
-        # Calculate next version using the reusable function
-        result = calculate_next_version(config)
-
-        # Verbose output
-        if verbose:
-            # Show current version info
-            if result["current_version"]:
-                click.echo(f"Current version: {result['current_version']}")
-            else:
-                click.echo("No tags found in repository")
-                click.echo(f"Will use first release: {FIRST_RELEASE}")
-
-            # Show commits found
-            click.echo(f"\nFound {len(result['commits'])} commits since last release")
-
-            # Show commit summary
-            if result["commits"]:
-                click.echo("\nCommit summary:")
-                # Load config to check which types map to release types
-                if config is None:
-                    git_root = get_git_root()
-                    config_path = str(git_root / "contiamo-release-please.yaml")
+    from contiamo_release_please.version import FIRST_RELEASE
+
+    # Calculate next version using the reusable function
+    result = calculate_next_version(config)
+
+    # Verbose output, collected and written in one go
+    if verbose:
+        report: list[str] = []
+
+        # Show current version info
+        if result["current_version"]:
+            report.append(f"Current version: {result['current_version']}")
+        else:
+            report.append("No tags found in repository")
+            report.append(f"Will use first release: {FIRST_RELEASE}")
+
+        # Show commits found
+        report.append(f"\nFound {len(result['commits'])} commits since last release")
+
+        # Show commit summary
+        if result["commits"]:
+            report.append("\nCommit summary:")
+            # Reuse the loaded config to check which types map to release types
+            release_types = result["config"].get_prefix_release_types()
+
+            for commit_type, count in result["commit_summary"].items():
+                release_type = release_types.get(commit_type)
+                if release_type:
+                    report.append(f"  {commit_type}: {count} → {release_type} bump")
                 else:
-                    config_path = config
-                release_config = load_config(config_path)
-
-                for commit_type, count in sorted(result["commit_summary"].items()):
-                    release_type = release_config.get_release_type_for_prefix(
-                        commit_type
-                    )
-                    if release_type:
-                        click.echo(f"  {commit_type}: {count} → {release_type} bump")
-                    else:
-                        click.echo(f"  {commit_type}: {count} → (no bump)")
-
-            # Show release type determined
+                    report.append(f"  {commit_type}: {count} → (no bump)")
+
+        # Show release type determined
+        if result["release_type"]:
+            report.append(f"\nDetermined release type: {result['release_type']}")
+
+        # Show version bump
+        if result["current_version"]:
             if result["release_type"]:
-                click.echo(f"\nDetermined release type: {result['release_type']}")
-
-            # Show version bump
-            if result["current_version"]:
-                if result["release_type"]:
-                    click.echo(
-                        f"Version bump: {result['current_version']} → {result['next_version']}"
-                    )
-                else:
-                    click.echo("No release needed (no relevant commits)")
+                report.append(
+                    f"Version bump: {result['current_version']} → {result['next_version']}"
+                )
             else:
-                click.echo(f"First release version: {result['next_version']}")
-            click.echo()
+                report.append("No release needed (no relevant commits)")
+        else:
+            report.append(f"First release version: {result['next_version']}")
+        report.append("")
 
-        # Output the final version (with prefix)
-        click.echo(result["next_version_prefixed"])
+        click.echo("\n".join(report))
 
-    except ConfigError as e:
-        click.echo(f"Configuration error: {e}", err=True)
-        sys.exit(1)
-    except GitError as e:
-        click.echo(f"Git error: {e}", err=True)
-        sys.exit(1)
-    except Exception as e:
-        click.echo(f"Error: {e}", err=True)
-        sys.exit(1)
+    # Output the final version (with prefix)
+    click.echo(result["next_version_prefixed"])
 
 
 @cli.command()
-@add_help_option
 @click.option(
     "--config",
     "-c",
@@ -217,6 +246,7 @@ def next_version(config: str | None, verbose: bool):
     is_flag=True,
     help="Show detailed information about changelog generation",
 )
+@_exit_on_error()
 def generate_changelog(
     config: str | None, output: str | None, dry_run: bool, verbose: bool
 ):
@@ -234,82 +264,75 @@ def generate_changelog(
 
       contiamo-release-please generate-changelog --dry-run
     """
-    try:
-        # Calculate next version using the reusable function
-        result = calculate_next_version(config)
-
-        # Load config to get changelog settings
-        if config is None:
-            git_root = get_git_root()
-            config_path = str(git_root / "contiamo-release-please.yaml")
-        else:
-            config_path = config
-        release_config = load_config(config_path)
+    from contiamo_release_please.changelog import (
+        format_changelog_entry,
+        group_commits_by_section,
+        prepend_to_changelog,
+    )
+    from contiamo_release_please.git import get_git_root
 
-        # Determine changelog path
-        if output:
-            changelog_path = Path(output)
-        else:
-            git_root = get_git_root()
-            changelog_filename = release_config.get_changelog_path()
-            changelog_path = git_root / changelog_filename
-
-        # Check if there are any commits to process
-        if not result["commits"]:
-            click.echo("No commits found since last release")
-            click.echo("Nothing to add to changelog")
-            return
-
-        # Group commits by section
-        grouped_commits = group_commits_by_section(result["commits"], release_config)
-
-        if not grouped_commits:
-            click.echo("No conventional commits found")
-            click.echo("Nothing to add to changelog")
-            return
-
-        # Format changelog entry
-        changelog_entry = format_changelog_entry(
-            result["next_version"], grouped_commits, release_config
-        )
-
-        # Verbose output
-        if verbose:
-            click.echo(f"Version: {result['next_version']}")
-            click.echo(f"Changelog path: {changelog_path}")
-            click.echo(f"\nFound {len(result['commits'])} commits")
-            click.echo(f"Grouped into {len(grouped_commits)} sections:")
-            for section_name, commits in grouped_commits.items():
-                click.echo(f"  {section_name}: {len(commits)} commits")
-            click.echo()
+    # Calculate next version using the reusable function
+    result = calculate_next_version(config)
 
-        # Show the changelog entry
-        if dry_run or verbose:
-            click.echo("Changelog entry:")
-            click.echo("-" * 80)
-            click.echo(changelog_entry)
-            click.echo("-" * 80)
-
-        # Write to file unless dry-run
-        if not dry_run:
-            prepend_to_changelog(changelog_path, changelog_entry)
-            click.echo(f"\nChangelog updated: {changelog_path}")
-        else:
-            click.echo("\nDry run - no files modified")
+    # Reuse the loaded config for changelog settings
+    release_config = result["config"]
 
-    except ConfigError as e:
-        click.echo(f"Configuration error: {e}", err=True)
-        sys.exit(1)
-    except GitError as e:
-        click.echo(f"Git error: {e}", err=True)
-        sys.exit(1)
-    except Exception as e:
-        click.echo(f"Error: {e}", err=True)
-        sys.exit(1)
+    # Determine changelog path
+    if output:
+        changelog_path = Path(output)
+    else:
+        changelog_filename = release_config.get_changelog_path()
+        changelog_path = get_git_root() / changelog_filename
+
+    # Check if there are any commits to process
+    if not result["commits"]:
+        click.echo("No commits found since last release")
+        click.echo("Nothing to add to changelog")
+        return
+
+    # Group commits by section
+    grouped_commits = group_commits_by_section(result["commits"], release_config)
+
+    if not grouped_commits:
+        click.echo("No conventional commits found")
+        click.echo("Nothing to add to changelog")
+        return
+
+    # Format changelog entry
+    changelog_entry = format_changelog_entry(
+        result["next_version"], grouped_commits, release_config
+    )
+
+    # Verbose output and the changelog entry, collected and written in one go
+    report: list[str] = []
+    if verbose:
+        report.append(f"Version: {result['next_version']}")
+        report.append(f"Changelog path: {changelog_path}")
+        report.append(f"\nFound {len(result['commits'])} commits")
+        report.append(f"Grouped into {len(grouped_commits)} sections:")
+        for section_name, commits in grouped_commits.items():
+            report.append(f"  {section_name}: {len(commits)} commits")
+        report.append("")
+
+    # Show the changelog entry
+    if dry_run or verbose:
+        report.append("Changelog entry:")
+        report.append("-" * 80)
+        report.append(changelog_entry)
+        report.append("-" * 80)
+
+    if report:
+        click.echo("\n".join(report))
+
+    # Write to file unless dry-run
+    if not dry_run:
+        prepend_to_changelog(changelog_path, changelog_entry)
+        click.echo(f"\nChangelog updated: {changelog_path}")
+    else:
+        click.echo("\nDry run - no files modified")
 
 
 @cli.command()
-@add_help_option
 @click.option(
     "--config",
     "-c",
@@ -328,80 +351,64 @@ def generate_changelog(
     is_flag=True,
     help="Show detailed information about file bumping",
 )
+@_exit_on_error(catch_all=False)
 def bump_files_cmd(config: str | None, dry_run: bool, verbose: bool):
     """Bump version in configured files.
 
     Automatically determines the next version based on commit history
     and updates version fields in configured files.
     """
-    try:
-        # Calculate next version using the reusable function
-        result = calculate_next_version(config)
-        version = result["next_version"]
-
-        # Load config to get extra files settings
-        if config is None:
-            git_root = get_git_root()
-            config_path = str(git_root / "contiamo-release-please.yaml")
-        else:
-            config_path = config
-        release_config = load_config(config_path)
+    from contiamo_release_please.bumper import bump_files
+    from contiamo_release_please.git import get_git_root
 
-        # Get extra files configuration
-        extra_files = release_config.get_extra_files()
+    # Calculate next version using the reusable function
+    result = calculate_next_version(config)
+    version = result["next_version"]
 
-        if not extra_files:
-            click.echo("No extra files configured for version bumping")
-            click.echo("Add 'extra-files' section to your config file")
-            return
+    # Get extra files configuration from the loaded config
+    extra_files = result["config"].get_extra_files()
 
-        # Get git root
-        git_root = get_git_root()
+    if not extra_files:
+        click.echo("No extra files configured for version bumping")
+        click.echo("Add 'extra-files' section to your config file")
+        return
 
-        # Verbose output
-        if verbose:
-            click.echo(f"Next version: {version}")
-            click.echo(f"Files to update: {len(extra_files)}")
-            if dry_run:
-                click.echo("Dry-run mode: no files will be modified")
-            click.echo()
+    # Get git root
+    git_root = get_git_root()
 
-        # Bump files
-        results = bump_files(extra_files, version, git_root, dry_run=dry_run)
+    # Verbose output
+    if verbose:
+        click.echo(f"Next version: {version}")
+        click.echo(f"Files to update: {len(extra_files)}")
+        if dry_run:
+            click.echo("Dry-run mode: no files will be modified")
+        click.echo()
 
-        # Display results
-        if results["updated"]:
-            click.echo("Updated files:")
-            for update in results["updated"]:
-                click.echo(f"  ✓ {update}")
+    # Bump files
+    results = bump_files(extra_files, version, git_root, dry_run=dry_run)
 
-        if results["errors"]:
-            click.echo("\nErrors:")
-            for error in results["errors"]:
-                click.echo(f"  ✗ {error}", err=True)
+    # Display results
+    if results["updated"]:
+        click.echo("Updated files:")
+        for update in results["updated"]:
+            click.echo(f"  ✓ {update}")
 
-        if dry_run:
-            click.echo("\nDry run - no files modified")
-        else:
-            click.echo(f"\nSuccessfully updated {len(results['updated'])} file(s)")
+    if results["errors"]:
+        click.echo("\nErrors:")
+        for error in results["errors"]:
+            click.echo(f"  ✗ {error}", err=True)
 
-        # Exit with error if there were any errors
-        if results["errors"]:
-            sys.exit(1)
+    if dry_run:
+        click.echo("\nDry run - no files modified")
+    else:
+        click.echo(f"\nSuccessfully updated {len(results['updated'])} file(s)")
 
-    except ConfigError as e:
-        click.echo(f"Configuration error: {e}", err=True)
-        sys.exit(1)
-    except GitError as e:
-        click.echo(f"Git error: {e}", err=True)
-        sys.exit(1)
-    except FileBumperError as e:
-        click.echo(f"Bumper error: {e}", err=True)
+    # Exit with error if there were any errors
+    if results["errors"]:
         sys.exit(1)
 
 
 @cli.command()
-@add_help_option
 @click.option(
     "--config",
     "-c",
@@ -426,6 +433,7 @@ def bump_files_cmd(config: str | None, dry_run: bool, verbose: bool):
     type=click.Choice(["github", "azure", "gitlab"], case_sensitive=False),
     help="Git hosting provider for PR creation (github, azure, gitlab)",
 )
+@_exit_on_error()
 def release(config: str | None, dry_run: bool, verbose: bool, git_host: str | None):
     """Create or update release branch with version bumps and changelog.
 
@@ -438,30 +446,19 @@ def release(config: str | None, dry_run: bool, verbose: bool, git_host: str | No
 
     The release branch can then be used to create a pull request for review.
     """
-    try:
-        create_release_branch_workflow(
-            config_path=config,
-            dry_run=dry_run,
-            verbose=verbose,
-            git_host=git_host,
-        )
-
-    except ConfigError as e:
-        click.echo(f"Configuration error: {e}", err=True)
-        sys.exit(1)
-    except GitError as e:
-        click.echo(f"Git error: {e}", err=True)
-        sys.exit(1)
-    except ReleaseError as e:
-        click.echo(f"Release error: {e}", err=True)
-        sys.exit(1)
-    except Exception as e:
-        click.echo(f"Error: {e}", err=True)
-        sys.exit(1)
+    from contiamo_release_please.release import (
+        create_release_branch_workflow,
+    )
+
+    create_release_branch_workflow(
+        config_path=config,
+        dry_run=dry_run,
+        verbose=verbose,
+        git_host=git_host,
+    )
 
 
 @cli.command()
-@add_help_option
 @click.option(
     "--config",
     "-c",
@@ -486,6 +483,7 @@ def release(config: str | None, dry_run: bool, verbose: bool, git_host: str | No
     type=click.Choice(["github", "azure", "gitlab"], case_sensitive=False),
     help="Git hosting provider (github, azure, gitlab). Auto-detected if not specified.",
 )
+@_exit_on_error()
 def tag_release(config: str | None, dry_run: bool, verbose: bool, git_host: str | None):
     """Create and push git tag for a merged release.
 
@@ -502,30 +500,43 @@ def tag_release(config: str | None, dry_run: bool, verbose: bool, git_host: str
     - 'contiamo-release-please release' created a release PR
     - The release PR was reviewed and merged
     """
-    try:
-        tag_release_workflow(
-            config_path=config,
-            dry_run=dry_run,
-            verbose=verbose,
-            git_host=git_host,
-        )
-
-    except ConfigError as e:
-        click.echo(f"Configuration error: {e}", err=True)
-        sys.exit(1)
-    except GitError as e:
-        click.echo(f"Git error: {e}", err=True)
-        sys.exit(1)
-    except ReleaseError as e:
-        click.echo(f"Release error: {e}", err=True)
-        sys.exit(1)
-    except Exception as e:
-        click.echo(f"Error: {e}", err=True)
-        sys.exit(1)
+    from contiamo_release_please.release import tag_release_workflow
+
+    tag_release_workflow(
+        config_path=config,
+        dry_run=dry_run,
+        verbose=verbose,
+        git_host=git_host,
+    )
+
+
+@cli.command()
+@click.argument("title")
+def validate_title(title: str):
+    """Validate that a pull request title follows the conventional commit format.
+
+    Exits with status 1 if the title is not of the form
+    <type>[(<scope>)][!]: <description>.
+
+    \b
+    Examples:
+      validate-title "feat: add new feature"
+      validate-title "fix(api): resolve authentication issue"
+    """
+    from contiamo_release_please.analyser import PR_TITLE_TYPES, is_valid_pr_title
+
+    if is_valid_pr_title(title):
+        click.echo("✓ PR title follows conventional commit format")
+        return
+
+    click.echo("❌ PR title does not follow conventional commit format", err=True)
+    click.echo("", err=True)
+    click.echo("Expected format: <type>[(<scope>)][!]: <description>", err=True)
+    click.echo(f"Allowed types: {', '.join(PR_TITLE_TYPES)}", err=True)
+    sys.exit(1)
 
 
 @cli.command()
-@add_help_option
 def generate_config():
     """Generate a complete configuration file template.
 
@@ -558,7 +569,6 @@ def generate_config():
 
 
 @cli.command()
-@add_help_option
 @click.argument(
     "shell",
     type=click.Choice(["bash", "zsh", "fish"], case_sensitive=False),
@@ -607,7 +617,6 @@ def completion(shell: str):
 
 
 @cli.command()
-@add_help_option
 @click.option(
     "--flavour",
     "-f",
@@ -627,6 +636,7 @@ def completion(shell: str):
     is_flag=True,
     help="Show detailed information",
 )
+@_exit_on_error()
 def bootstrap(flavour: str, dry_run: bool, verbose: bool):
     """Bootstrap CI/CD workflows and configuration files.
 
@@ -646,61 +656,53 @@ def bootstrap(flavour: str, dry_run: bool, verbose: bool):
         check_existing_files,
     )
 
-    try:
-        if verbose:
-            click.echo(f"Bootstrapping {flavour} CI/CD workflows...")
-            click.echo(f"Working directory: {Path.cwd()}")
-            if dry_run:
-                click.echo("Dry-run mode: no files will be created")
-            click.echo()
+    if verbose:
+        click.echo(f"Bootstrapping {flavour} CI/CD workflows...")
+        click.echo(f"Working directory: {Path.cwd()}")
+        if dry_run:
+            click.echo("Dry-run mode: no files will be created")
+        click.echo()
 
-        # Generate files
-        created_files, instructions = bootstrap_flavour(
-            flavour=flavour.lower(),  # type: ignore[arg-type]
-            dry_run=dry_run,
-        )
+    # Generate files
+    created_files, instructions = bootstrap_flavour(
+        flavour=flavour.lower(),  # type: ignore[arg-type]
+        dry_run=dry_run,
+    )
 
-        # Check for existing files (before creation in dry-run mode)
-        if dry_run:
-            existing_files = check_existing_files(created_files)
-            if existing_files:
-                click.echo(
-                    "Warning: The following files already exist and would be overwritten:"
-                )
-                for f in existing_files:
-                    click.echo(f"  {f.relative_to(Path.cwd())}")
-                click.echo()
+    # Check for existing files (before creation in dry-run mode)
+    if dry_run:
+        existing_files = check_existing_files(created_files)
+        if existing_files:
+            click.echo(
+                "Warning: The following files already exist and would be overwritten:"
+            )
+            for f in existing_files:
+                click.echo(f"  {f.relative_to(Path.cwd())}")
+            click.echo()
 
-        # Show created files
+    # Show created files
+    if dry_run:
+        click.echo("Would create the following files:")
+    else:
+        click.echo("Created the following files:")
+
+    for file_path in created_files:
+        relative_path = file_path.relative_to(Path.cwd())
         if dry_run:
-            click.echo("Would create the following files:")
+            status = "would create"
+        elif file_path.exists():
+            status = "✓"
         else:
-            click.echo("Created the following files:")
-
-        for file_path in created_files:
-            relative_path = file_path.relative_to(Path.cwd())
-            if dry_run:
-                status = "would create"
-            elif file_path.exists():
-                status = "✓"
-            else:
-                status = "✗"
-            click.echo(f"  {status} {relative_path}")
+            status = "✗"
+        click.echo(f"  {status} {relative_path}")
 
-        click.echo()
-
-        # Show instructions
-        if not dry_run:
-            click.echo(instructions)
-        else:
-            click.echo("\nRun without --dry-run to create the files.")
+    click.echo()
 
-    except ValueError as e:
-        click.echo(f"Error: {e}", err=True)
-        sys.exit(1)
-    except Exception as e:
-        click.echo(f"Error: {e}", err=True)
-        sys.exit(1)
+    # Show instructions
+    if not dry_run:
+        click.echo(instructions)
+    else:
+        click.echo("\nRun without --dry-run to create the files.")
 
 
 if __name__ == "__main__":
@@ -333,12 +333,13 @@ def create_release_branch_workflow(
             "Use --git-host to specify provider explicitly: --git-host github|azure|gitlab"
         )
 
-    # Validate credentials for detected git host (even in dry-run)
+    # Validate credentials for detected git host (even in dry-run); the
+    # resolved token is reused when creating the pull request below
     if determined_git_host.lower() == "github":
         from contiamo_release_please.github import GitHubError, get_github_token
 
         try:
-            get_github_token(config._config)
+            token = get_github_token(config._config)
         except GitHubError as e:
             raise ReleaseError(f"GitHub detected but authentication failed: {e}")
 
@@ -346,7 +347,7 @@ def create_release_branch_workflow(
         from contiamo_release_please.azure import AzureDevOpsError, get_azure_token
 
         try:
-            get_azure_token(config._config)
+            token = get_azure_token(config._config)
         except AzureDevOpsError as e:
             raise ReleaseError(f"Azure DevOps detected but authentication failed: {e}")
 
@@ -354,7 +355,7 @@ def create_release_branch_workflow(
         from contiamo_release_please.gitlab import GitLabError, get_gitlab_token
 
         try:
-            get_gitlab_token(config._config)
+            token = get_gitlab_token(config._config)
         except GitLabError as e:
             raise ReleaseError(f"GitLab detected but authentication failed: {e}")
 
@@ -466,7 +467,6 @@ def create_release_branch_workflow(
         from contiamo_release_please.github import (
             GitHubError,
             create_or_update_pr,
-            get_github_token,
             get_repo_info,
         )
 
@@ -474,9 +474,6 @@ def create_release_branch_workflow(
             if verbose:
                 click.echo("\nCreating/updating GitHub pull request...")
 
-            # Get authentication
-            token = get_github_token(config._config)
-
             # Get repo info
             owner, repo = get_repo_info(git_root)
 
@@ -513,16 +510,12 @@ def create_release_branch_workflow(
             AzureDevOpsError,
             create_or_update_pr,
             get_azure_repo_info,
-            get_azure_token,
         )
 
         try:
             if verbose:
                 click.echo("\nCreating/updating Azure DevOps pull request...")
 
-            # Get authentication
-            token = get_azure_token(config._config)
-
             # Get repo info
             org, project, repo = get_azure_repo_info(git_root)
 
@@ -560,16 +553,12 @@ def create_release_branch_workflow(
             GitLabError,
             create_or_update_pr,
             get_gitlab_repo_info,
-            get_gitlab_token,
         )
 
         try:
             if verbose:
                 click.echo("\nCreating/updating GitLab merge request...")
 
-            # Get authentication
-            token = get_gitlab_token(config._config)
-
             # Get repo info
             host, project_path = get_gitlab_repo_info(git_root)
 
@@ -6,6 +6,7 @@ import pytest
 
 from contiamo_release_please.analyser import (
     ParsedCommit,
+    analyse,
     analyse_commits,
     check_breaking_change,
     get_commit_type_summary,
@@ -179,6 +180,15 @@ class TestAnalyseCommits:
         result = analyse_commits(commits, config)
         assert result == "major"
 
+    def test_breaking_type_after_minor(self, config):
+        """Test that a literal breaking commit type after a feat is still major."""
+        commits = [
+            "feat: minor change",
+            "breaking: remove legacy API",
+        ]
+        result = analyse_commits(commits, config)
+        assert result == "major"
+
     def test_unknown_commit_types_ignored(self, config):
         """Test that unknown commit types are ignored."""
         commits = [
@@ -213,6 +223,7 @@ class TestGetCommitTypeSummary:
         assert summary["feat"] == 2
         assert summary["fix"] == 1
         assert summary["chore"] == 1
+        assert list(summary) == sorted(summary)
 
     def test_breaking_in_summary(self, config):
         """Test that breaking changes are counted separately."""
@@ -225,6 +236,26 @@ class TestGetCommitTypeSummary:
         assert summary["feat"] == 1
 
 
+class TestAnalyse:
+    """Tests for analyse function."""
+
+    def test_matches_separate_calls(self, config):
+        """Test that the combined pass matches the individual functions."""
+        commits = [
+            "feat!: breaking feature",
+            "fix: fix 1",
+            "feat: feature 1",
+            "docs: update readme",
+        ]
+        release_type, summary = analyse(commits, config)
+        assert release_type == analyse_commits(commits, config) == "major"
+        assert summary == get_commit_type_summary(commits, config)
+
+    def test_no_commits(self, config):
+        """Test that an empty commit list yields no release and empty summary."""
+        assert analyse([], config) == (None, {})
+
+
 class TestIsReleaseCommit:
     """Tests for is_release_commit function."""
 
@@ -325,3 +356,23 @@ class TestIsReleaseCommit:
         release_branch = "release-please--branches--develop"
 
         assert is_release_commit(commit, release_branch) is True
+
+
+@pytest.mark.parametrize(
+    "title,expected",
+    [
+        ("feat: add new feature", True),
+        ("fix(api): resolve authentication issue", True),
+        ("feat!: breaking change in API", True),
+        ("refactor(core)!: drop legacy loader", True),
+        ("feature: add new feature", False),
+        ("feat:missing space", False),
+        ("Merged PR 12: feat: add thing", False),
+        ("update README", False),
+    ],
+)
+def test_is_valid_pr_title(title, expected):
+    """Test pull request title validation against the conventional commit format."""
+    from contiamo_release_please.analyser import is_valid_pr_title
+
+    assert is_valid_pr_title(title) is expected
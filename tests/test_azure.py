@@ -0,0 +1,127 @@
+"""Tests for Azure DevOps API integration."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from contiamo_release_please.azure import (
+    PullRequestExistsError,
+    create_or_update_pr,
+)
+
+PR_ARGS = (
+    "org",
+    "project",
+    "repo",
+    "chore(main): release 1.0.0",
+    "Release notes",
+    "release-please--branches--main",
+    "main",
+    "test-token",
+)
+
+
+def _response(status_code: int, body: dict) -> requests.Response:
+    """Build an API response with a JSON body."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = (
+        "https://dev.azure.com/org/project/_apis/git/repositories/repo/pullrequests"
+    )
+    response._content = json.dumps(body).encode()
+    return response
+
+
+def test_create_or_update_pr_creates_new(capsys):
+    """Test create_or_update_pr creates a PR without looking one up."""
+    mock_find = MagicMock()
+    mock_update = MagicMock()
+
+    with (
+        patch(
+            "requests.Session.post",
+            return_value=_response(201, {"pullRequestId": 12}),
+        ),
+        patch("contiamo_release_please.azure.find_existing_pr", mock_find),
+        patch("contiamo_release_please.azure.update_pull_request", mock_update),
+    ):
+        result = create_or_update_pr(*PR_ARGS, verbose=True)
+
+    assert result == {"pullRequestId": 12}
+    mock_find.assert_not_called()
+    mock_update.assert_not_called()
+    assert "Created new PR" in capsys.readouterr().out
+
+
+def test_create_or_update_pr_updates_on_conflict(capsys):
+    """Test create_or_update_pr finds and updates the PR after a 409."""
+    mock_find = MagicMock(return_value=7)
+    mock_update = MagicMock(return_value={"pullRequestId": 7})
+
+    with (
+        patch(
+            "requests.Session.post",
+            return_value=_response(409, {"message": "Conflict"}),
+        ),
+        patch("contiamo_release_please.azure.find_existing_pr", mock_find),
+        patch("contiamo_release_please.azure.update_pull_request", mock_update),
+    ):
+        result = create_or_update_pr(*PR_ARGS, verbose=True)
+
+    assert result == {"pullRequestId": 7}
+    mock_find.assert_called_once_with(
+        "org", "project", "repo", "release-please--branches--main", "main", "test-token"
+    )
+    assert mock_update.call_args.args[3] == 7
+    output = capsys.readouterr().out
+    assert "Updating existing PR #7" in output
+    assert "Created new PR" not in output
+
+
+def test_create_or_update_pr_updates_on_tf401179():
+    """Test create_or_update_pr treats a TF401179 error body as a conflict."""
+    mock_find = MagicMock(return_value=7)
+    mock_update = MagicMock(return_value={"pullRequestId": 7})
+    body = {
+        "message": "TF401179: An active pull request for the source and target "
+        "branch already exists."
+    }
+
+    with (
+        patch("requests.Session.post", return_value=_response(400, body)),
+        patch("contiamo_release_please.azure.find_existing_pr", mock_find),
+        patch("contiamo_release_please.azure.update_pull_request", mock_update),
+    ):
+        result = create_or_update_pr(*PR_ARGS)
+
+    assert result == {"pullRequestId": 7}
+    mock_find.assert_called_once()
+    mock_update.assert_called_once()
+
+
+def test_create_or_update_pr_reraises_conflict_without_pr():
+    """Test create_or_update_pr re-raises when the conflicting PR isn't found."""
+    mock_update = MagicMock()
+
+    with (
+        patch(
+            "requests.Session.post",
+            return_value=_response(409, {"message": "Conflict"}),
+        ),
+        patch(
+            "contiamo_release_please.azure.find_existing_pr",
+            MagicMock(return_value=None),
+        ),
+        patch("contiamo_release_please.azure.update_pull_request", mock_update),
+    ):
+        with pytest.raises(PullRequestExistsError, match="Conflict"):
+            create_or_update_pr(*PR_ARGS)
+
+    mock_update.assert_not_called()
+
+
+def test_create_or_update_pr_dry_run():
+    """Test create_or_update_pr in dry-run mode."""
+    assert create_or_update_pr(*PR_ARGS, dry_run=True) is None
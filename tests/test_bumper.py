@@ -109,6 +109,21 @@ def test_yaml_bumper_helm_chart():
         assert result["appVersion"] == "v0.1.0"  # Unchanged
 
 
+def test_yaml_bumper_skips_unchanged_file():
+    """Test that a file already at the target version is not rewritten."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yaml_file = Path(tmpdir) / "test.yaml"
+
+        # Comments would be lost if the file were re-serialised
+        original = "# Chart metadata\nversion: 1.2.3\nname: test\n"
+        yaml_file.write_text(original)
+
+        bumper = YamlFileBumper()
+        bumper.bump_version(yaml_file, "$.version", "1.2.3")
+
+        assert yaml_file.read_text() == original
+
+
 def test_yaml_bumper_file_not_found():
     """Test error when file doesn't exist."""
     bumper = YamlFileBumper()
@@ -679,6 +694,25 @@ Version 1.0.0 or v1.0.0
         assert "1.0.0" not in result
 
 
+def test_generic_bumper_already_at_version():
+    """Test generic bumper accepts a block that already has the new version."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        test_file = Path(tmpdir) / "README.md"
+
+        content = """<!--- contiamo-release-please-bump-start --->
+Version 2.0.0
+<!--- contiamo-release-please-bump-end --->
+"""
+        test_file.write_text(content)
+
+        from contiamo_release_please.bumper import GenericFileBumper
+
+        bumper = GenericFileBumper()
+        bumper.bump_version(test_file, "", "2.0.0")
+
+        assert test_file.read_text() == content
+
+
 def test_generic_bumper_multiple_blocks():
     """Test generic bumper handles multiple marker blocks."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -8,9 +8,11 @@ import pytest
 
 from contiamo_release_please.analyser import ParsedCommit
 from contiamo_release_please.changelog import (
+    extract_changelog_entry,
     extract_changelog_for_version,
     format_changelog_entry,
     group_commits_by_section,
+    prepend_changelog_entry,
     prepend_to_changelog,
 )
 from contiamo_release_please.config import ReleaseConfig
@@ -358,6 +360,20 @@ def test_config_get_changelog_sections_default(temp_config_file):
     assert sections[1] == {"type": "fix", "section": "Bug Fixes"}
 
 
+def test_config_section_lookups(temp_config_file):
+    """Test the derived section mapping and de-duplicated section order."""
+    config = ReleaseConfig(temp_config_file)
+
+    assert config.type_to_section_map["ci"] == "Miscellaneous Changes"
+    assert config.ordered_section_names == (
+        "Features",
+        "Bug Fixes",
+        "Miscellaneous Changes",
+        "Documentation",
+        "Code Refactoring",
+    )
+
+
 def test_extract_changelog_for_version():
     """Test extracting changelog entry for a specific version."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -440,3 +456,16 @@ def test_extract_changelog_for_version_file_not_found():
     changelog_path = Path("/nonexistent/CHANGELOG.md")
     result = extract_changelog_for_version(changelog_path, "1.0.0")
     assert result is None
+
+
+def test_changelog_content_round_trip():
+    """Test prepending and extracting entries on in-memory content."""
+    content = "# Changelog\n\n## [1.0.0] (2025-01-01)\n\n### Features\n\n* first\n"
+    new_entry = "## [1.1.0] (2025-02-01)\n\n### Bug Fixes\n\n* fix\n"
+
+    updated = prepend_changelog_entry(content, new_entry)
+
+    assert updated.index("## [1.1.0]") < updated.index("## [1.0.0]")
+    assert extract_changelog_entry(updated, "1.1.0") == "### Bug Fixes\n\n* fix"
+    assert extract_changelog_entry(updated, "1.0.0") == "### Features\n\n* first"
+    assert extract_changelog_entry(updated, "2.0.0") is None
@@ -7,7 +7,7 @@ import pytest
 import yaml
 
 from contiamo_release_please.ci_templates import generate_config_template
-from contiamo_release_please.config import ReleaseConfig
+from contiamo_release_please.config import ConfigError, ReleaseConfig, load_config
 
 
 def test_generate_config_template_returns_string():
@@ -196,3 +196,66 @@ def test_generated_config_includes_marker_documentation():
     # Check for marker documentation
     assert "contiamo-release-please-bump-start" in template
     assert "contiamo-release-please-bump-end" in template
+
+
+def test_prefix_lookup_respects_release_type_priority(tmp_path):
+    """Test that a prefix listed under several release types resolves to the highest."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(
+        "release-rules:\n"
+        "  major: [breaking]\n"
+        "  minor: [feat, breaking]\n"
+        "  patch: [fix, feat]\n"
+    )
+
+    config = ReleaseConfig(config_file)
+
+    assert config.get_release_type_for_prefix("breaking") == "major"
+    assert config.get_release_type_for_prefix("feat") == "minor"
+    assert config.get_release_type_for_prefix("fix") == "patch"
+    assert config.get_release_type_for_prefix("docs") is None
+    assert config.get_all_valid_prefixes() == {"breaking", "feat", "fix"}
+    assert config.get_prefix_release_types() == {
+        "breaking": "major",
+        "feat": "minor",
+        "fix": "patch",
+    }
+
+
+def test_load_config_reuses_unchanged_file(tmp_path):
+    """Test that load_config only re-parses a config file when it changes."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("release-rules:\n  minor: [feat]\n")
+
+    first = load_config(config_file)
+    assert load_config(str(config_file)) is first
+
+    config_file.write_text("release-rules:\n  minor: [feat]\nversion-prefix: v\n")
+    reloaded = load_config(config_file)
+    assert reloaded is not first
+    assert reloaded.get_version_prefix() == "v"
+
+
+def test_load_config_missing_file(tmp_path):
+    """Test that a missing config file raises ConfigError."""
+    with pytest.raises(ConfigError, match="Configuration file not found"):
+        load_config(tmp_path / "missing.yaml")
+
+
+def test_release_config_keeps_only_git_host_sections(tmp_path):
+    """Test that ReleaseConfig uses slots and keeps only the sections needed for tokens."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(
+        "release-rules:\n"
+        "  minor: [feat]\n"
+        "source-branch: develop\n"
+        "github:\n"
+        "  token: ghp-test\n"
+    )
+
+    config = ReleaseConfig(config_file)
+
+    assert not hasattr(config, "__dict__")
+    assert config._config == {"github": {"token": "ghp-test"}}
+    assert config.get_source_branch() == "develop"
+    assert config.get_release_branch_name() == "release-please--branches--develop"
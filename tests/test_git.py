@@ -0,0 +1,385 @@
+"""Tests for git operations."""
+
+import configparser
+import os
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from contiamo_release_please import git
+from contiamo_release_please.git import (
+    GitError,
+    _config_remote_url,
+    _is_shallow_repository,
+    _local_tags,
+    detect_git_host,
+    get_commits_since_tag,
+    get_latest_tag,
+    get_remote_url,
+)
+
+
+def _git(cwd, *args):
+    """Run a git command in a test repository."""
+    return subprocess.run(
+        ["git", *args], cwd=cwd, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+@pytest.fixture(autouse=True)
+def isolated_git_config(tmp_path, monkeypatch):
+    """Point the global git config at an empty file in a temporary home."""
+    home = tmp_path / "home"
+    home.mkdir()
+    global_config = home / ".gitconfig"
+    global_config.write_text("")
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.delenv("XDG_CONFIG_HOME", raising=False)
+    for name in list(os.environ):
+        if name.startswith("GIT_"):
+            monkeypatch.delenv(name)
+    get_remote_url.cache_clear()
+    yield global_config
+    get_remote_url.cache_clear()
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Create an empty git repository."""
+    path = tmp_path / "repo"
+    path.mkdir()
+    _git(path, "init", "-q")
+    return path
+
+
+def _commit(repo, message, *config):
+    """Create an empty commit, optionally with extra git config options."""
+    args = []
+    for option in config:
+        args += ["-c", option]
+    _git(
+        repo,
+        *args,
+        "-c",
+        "user.name=Test",
+        "-c",
+        "user.email=test@example.com",
+        "commit",
+        "-q",
+        "--allow-empty",
+        "-m",
+        message,
+    )
+
+
+def _import_history(repo, count, tag=None, tag_at=1):
+    """Create `count` commits on main with fast-import, optionally tagging one."""
+    stream = []
+    for i in range(1, count + 1):
+        message = f"feat: commit {i}".encode()
+        stream.append(
+            f"commit refs/heads/main\nmark :{i}\n"
+            f"committer Test <test@example.com> {1700000000 + i} +0000\n"
+            f"data {len(message)}\n".encode()
+            + message
+            + b"\n"
+        )
+    if tag:
+        stream.append(f"reset refs/tags/{tag}\nfrom :{tag_at}\n".encode())
+    subprocess.run(
+        ["git", "fast-import", "--quiet"],
+        cwd=repo,
+        input=b"".join(stream),
+        check=True,
+    )
+    _git(repo, "symbolic-ref", "HEAD", "refs/heads/main")
+
+
+def _write_config(repo, remote_section):
+    (repo / ".git" / "config").write_text(
+        "[core]\n\trepositoryformatversion = 0\n" + remote_section
+    )
+
+
+def test_config_remote_url_reads_repository_config(repo):
+    """Test reading a plain remote URL without spawning git."""
+    _write_config(
+        repo,
+        '[remote "origin"]\n'
+        "\turl = https://github.com/owner/repo.git\n"
+        "\tfetch = +refs/heads/*:refs/remotes/origin/*\n",
+    )
+
+    assert _config_remote_url(repo, "origin") == "https://github.com/owner/repo.git"
+    assert _config_remote_url(repo, "upstream") is None
+
+
+def test_config_remote_url_strips_inline_comments(repo):
+    """Test that trailing comments are stripped like git does."""
+    _write_config(
+        repo, '[remote "origin"]\n\turl = https://github.com/owner/repo ; mirror\n'
+    )
+
+    assert _config_remote_url(repo, "origin") == "https://github.com/owner/repo"
+    assert get_remote_url(repo) == _git(repo, "remote", "get-url", "origin")
+
+
+def test_config_remote_url_defers_multiple_urls(repo):
+    """Test that a remote with several URLs is left to git."""
+    _write_config(
+        repo,
+        '[remote "origin"]\n'
+        "\turl = https://github.com/owner/first\n"
+        "\turl = https://github.com/owner/second\n",
+    )
+
+    with pytest.raises(configparser.DuplicateOptionError):
+        _config_remote_url(repo, "origin")
+    assert get_remote_url(repo) == "https://github.com/owner/first"
+
+
+def test_config_remote_url_defers_quoted_values(repo):
+    """Test that quoted URLs are left to git."""
+    _write_config(repo, '[remote "origin"]\n\turl = "https://github.com/o/r"\n')
+
+    assert _config_remote_url(repo, "origin") is None
+    assert get_remote_url(repo) == "https://github.com/o/r"
+
+
+def test_config_remote_url_defers_repository_rewrites(repo):
+    """Test that URL rewrites in the repository config are left to git."""
+    _write_config(
+        repo,
+        '[url "https://github.com/"]\n\tinsteadOf = gh:\n'
+        '[remote "origin"]\n\turl = gh:owner/repo\n',
+    )
+
+    assert _config_remote_url(repo, "origin") is None
+    assert get_remote_url(repo) == "https://github.com/owner/repo"
+
+
+@pytest.mark.parametrize(
+    "global_section",
+    [
+        '[url "https://github.com/"]\n\tinsteadOf = gh:\n',
+        "[include]\n\tpath = other.gitconfig\n",
+        '[includeIf "gitdir:~/work/"]\n\tpath = work.gitconfig\n',
+    ],
+)
+def test_config_remote_url_defers_global_config(
+    repo, isolated_git_config, global_section
+):
+    """Test that includes and rewrites in the global config are left to git."""
+    isolated_git_config.write_text(global_section)
+    _write_config(repo, '[remote "origin"]\n\turl = gh:owner/repo\n')
+
+    assert _config_remote_url(repo, "origin") is None
+
+
+def test_get_remote_url_applies_global_rewrites(repo, isolated_git_config):
+    """Test that a global insteadOf rule is honoured for host detection."""
+    isolated_git_config.write_text('[url "https://github.com/"]\n\tinsteadOf = gh:\n')
+    _write_config(repo, '[remote "origin"]\n\turl = gh:a/b\n')
+
+    assert get_remote_url(repo) == "https://github.com/a/b"
+    assert detect_git_host(repo) == "github"
+
+
+@pytest.mark.parametrize(
+    "name", ["GIT_CONFIG_COUNT", "GIT_CONFIG_GLOBAL", "GIT_DIR", "GIT_COMMON_DIR"]
+)
+def test_config_remote_url_defers_git_environment(repo, monkeypatch, name):
+    """Test that a repository or config chosen via the environment is left to git."""
+    monkeypatch.setenv(name, "1")
+    _write_config(repo, '[remote "origin"]\n\turl = https://github.com/o/r\n')
+
+    assert _config_remote_url(repo, "origin") is None
+
+
+def test_get_remote_url_honours_git_dir(repo, tmp_path, monkeypatch):
+    """Test that GIT_DIR selects the repository whose remote is reported."""
+    _write_config(repo, '[remote "origin"]\n\turl = https://github.com/a/b\n')
+    other = tmp_path / "other"
+    other.mkdir()
+    _git(other, "init", "-q")
+    _write_config(other, '[remote "origin"]\n\turl = https://gitlab.com/c/d\n')
+    monkeypatch.setenv("GIT_DIR", str(other / ".git"))
+
+    assert get_remote_url(repo) == "https://gitlab.com/c/d"
+    assert detect_git_host(repo) == "gitlab"
+
+
+def test_get_remote_url_without_home_directory(repo, monkeypatch):
+    """Test falling back to git when the home directory can't be determined."""
+    _write_config(repo, '[remote "origin"]\n\turl = https://github.com/a/b\n')
+
+    def no_home():
+        raise RuntimeError("Could not determine home directory.")
+
+    monkeypatch.setattr(Path, "home", no_home)
+
+    assert get_remote_url(repo) == "https://github.com/a/b"
+    assert detect_git_host(repo) == "github"
+
+
+def test_get_commits_since_tag_streams_subjects(repo):
+    """Test reading commit subjects newest first."""
+    _commit(repo, "feat: first")
+    _git(repo, "tag", "v1.0.0")
+    _commit(repo, "fix: second")
+    _commit(repo, "feat: third\n\nbody line")
+
+    assert get_commits_since_tag(cwd=repo) == [
+        "feat: third",
+        "fix: second",
+        "feat: first",
+    ]
+    assert get_commits_since_tag("v1.0.0", cwd=repo) == ["feat: third", "fix: second"]
+
+
+def test_get_commits_since_tag_replaces_undecodable_bytes(repo):
+    """Test that non-UTF-8 log output is decoded with replacement characters."""
+    _commit(repo, "fix: caf\u00e9")
+    _git(repo, "config", "i18n.logOutputEncoding", "ISO-8859-1")
+
+    assert get_commits_since_tag(cwd=repo) == ["fix: caf\ufffd"]
+
+
+def test_get_commits_since_tag_unknown_tag(repo):
+    """Test that git's error message is reported for an unknown tag."""
+    _commit(repo, "feat: first")
+
+    with pytest.raises(GitError, match="Git command failed: .*v9.9.9"):
+        get_commits_since_tag("v9.9.9", cwd=repo)
+
+
+def test_get_latest_tag_deepens_shallow_clone(tmp_path):
+    """Test that a shallow clone is deepened until the last tag is reachable."""
+    origin = tmp_path / "origin"
+    origin.mkdir()
+    _git(origin, "init", "-q")
+    _import_history(origin, 300, tag="v1.0.0", tag_at=150)
+    clone = tmp_path / "clone"
+    _git(tmp_path, "clone", "-q", "--depth", "50", origin.as_uri(), str(clone))
+    assert _is_shallow_repository(clone)
+    assert _git(clone, "tag") == ""
+
+    with patch.object(git, "_run_git_command", wraps=git._run_git_command) as run_git:
+        assert get_latest_tag(clone, "v") == "v1.0.0"
+
+    fetches = [c.args[0] for c in run_git.call_args_list if c.args[0][0] == "fetch"]
+    # No plain tag fetch on a shallow clone; 50 + 50 + 100 reaches commit 150
+    assert fetches == [
+        ["fetch", "--deepen=50", "--tags", "--no-recurse-submodules", "origin"],
+        ["fetch", "--deepen=100", "--tags", "--no-recurse-submodules", "origin"],
+    ]
+    # Only as much history as needed was fetched
+    assert _is_shallow_repository(clone)
+    assert _git(clone, "rev-list", "--count", "HEAD") == "200"
+
+
+def test_get_latest_tag_unshallows_past_max_depth(repo):
+    """Test that deepening doubles and switches to --unshallow past 800."""
+    fetches = []
+
+    def fake_run_git(args, cwd=None, error_prefix="Git command failed"):
+        fetches.append(args[1])
+        return ""
+
+    with (
+        patch.object(git, "_is_shallow_repository", side_effect=[True] * 6 + [False]),
+        patch.object(git, "_find_latest_tag", return_value=None),
+        patch.object(git, "_run_git_command", side_effect=fake_run_git),
+    ):
+        assert get_latest_tag(repo, "v") is None
+
+    assert fetches == [
+        "--deepen=50",
+        "--deepen=100",
+        "--deepen=200",
+        "--deepen=400",
+        "--deepen=800",
+        "--unshallow",
+    ]
+
+
+def test_get_latest_tag_not_shallow(repo):
+    """Test that a full clone is not reported as shallow."""
+    _commit(repo, "feat: first")
+
+    assert not _is_shallow_repository(repo)
+    assert get_latest_tag(repo, "v") is None
+
+
+def test_get_latest_tag_prefers_release_over_prerelease(repo):
+    """Test version ordering of reachable semver tags."""
+    _commit(repo, "feat: first")
+    _git(repo, "tag", "v1.9.0")
+    _commit(repo, "feat: second")
+    _git(repo, "tag", "v1.10.0-rc1")
+    _git(repo, "tag", "v1.10.0")
+    _git(repo, "tag", "v1")
+
+    # v1.10.0 beats v1.9.0 and its own release candidate; 'v1' is ignored
+    assert get_latest_tag(repo, "v") == "v1.10.0"
+
+    _commit(repo, "feat: third")
+    _git(repo, "tag", "v1.11.0-rc1")
+    assert get_latest_tag(repo, "v") == "v1.11.0-rc1"
+
+
+def test_get_latest_tag_ignores_unmerged_tags(repo):
+    """Test that tags not reachable from HEAD are skipped."""
+    _commit(repo, "feat: first")
+    _git(repo, "tag", "1.0.0")
+    _git(repo, "checkout", "-q", "-b", "side")
+    _commit(repo, "feat: side")
+    _git(repo, "tag", "2.0.0")
+    _git(repo, "checkout", "-q", "-")
+
+    assert get_latest_tag(repo, "") == "1.0.0"
+
+
+def test_local_tags_reads_packed_and_loose_refs(repo):
+    """Test listing tags from packed-refs and nested loose refs."""
+    _commit(repo, "feat: first")
+    _git(
+        repo,
+        "-c",
+        "user.name=T",
+        "-c",
+        "user.email=t@e",
+        "tag",
+        "-a",
+        "-m",
+        "x",
+        "v1.0.0",
+    )
+    _git(repo, "tag", "packed-only")
+    _git(repo, "pack-refs", "--all")
+    _git(repo, "tag", "a/b")
+
+    assert not (repo / ".git" / "refs" / "tags" / "v1.0.0").exists()
+    # The annotated tag's peeled "^<sha>" line must not become a tag
+    assert "^" in (repo / ".git" / "packed-refs").read_text()
+    assert _local_tags(repo) == {"v1.0.0", "packed-only", "a/b"}
+
+
+def test_local_tags_from_linked_worktree(repo, tmp_path):
+    """Test that a linked worktree reads the main repository's tags."""
+    _commit(repo, "feat: first")
+    _git(repo, "tag", "v1.0.0")
+    worktree = tmp_path / "worktree"
+    _git(repo, "worktree", "add", "-q", str(worktree))
+
+    assert (worktree / ".git").is_file()
+    assert _local_tags(worktree) == {"v1.0.0"}
+
+
+def test_local_tags_defers_reftable(repo):
+    """Test that the reftable backend is left to git."""
+    (repo / ".git" / "reftable").mkdir()
+
+    assert _local_tags(repo) is None
@@ -9,6 +9,7 @@ import requests
 
 from contiamo_release_please.gitlab import (
     GitLabError,
+    MergeRequestExistsError,
     create_gitlab_release,
     create_or_update_pr,
     create_pull_request,
@@ -49,11 +50,11 @@ def test_get_gitlab_token_not_found():
 
 def test_get_gitlab_repo_info_https():
     """Test parsing HTTPS GitLab URL."""
-    mock_run = MagicMock()
-    mock_run.stdout = "https://gitlab.com/owner/repo.git\n"
-    mock_run.returncode = 0
+    remote_url = "https://gitlab.com/owner/repo.git"
 
-    with patch("subprocess.run", return_value=mock_run):
+    with patch(
+        "contiamo_release_please.gitlab.get_remote_url", return_value=remote_url
+    ):
         host, project_path = get_gitlab_repo_info(Path("/test"))
 
     assert host == "gitlab.com"
@@ -62,11 +63,11 @@ def test_get_gitlab_repo_info_https():
 
 def test_get_gitlab_repo_info_https_custom_instance():
     """Test parsing custom GitLab instance HTTPS URL."""
-    mock_run = MagicMock()
-    mock_run.stdout = "https://gitlab.devops.telekom.de/gsus/innovationplatform/dcpo/agent/apps/bond.git\n"
-    mock_run.returncode = 0
+    remote_url = "https://gitlab.devops.telekom.de/gsus/innovationplatform/dcpo/agent/apps/bond.git"
 
-    with patch("subprocess.run", return_value=mock_run):
+    with patch(
+        "contiamo_release_please.gitlab.get_remote_url", return_value=remote_url
+    ):
         host, project_path = get_gitlab_repo_info(Path("/test"))
 
     assert host == "gitlab.devops.telekom.de"
@@ -75,11 +76,11 @@ def test_get_gitlab_repo_info_https_custom_instance():
 
 def test_get_gitlab_repo_info_ssh():
     """Test parsing SSH GitLab URL."""
-    mock_run = MagicMock()
-    mock_run.stdout = "git@gitlab.com:owner/repo.git\n"
-    mock_run.returncode = 0
+    remote_url = "git@gitlab.com:owner/repo.git"
 
-    with patch("subprocess.run", return_value=mock_run):
+    with patch(
+        "contiamo_release_please.gitlab.get_remote_url", return_value=remote_url
+    ):
         host, project_path = get_gitlab_repo_info(Path("/test"))
 
     assert host == "gitlab.com"
@@ -88,11 +89,11 @@ def test_get_gitlab_repo_info_ssh():
 
 def test_get_gitlab_repo_info_ssh_custom_instance():
     """Test parsing custom GitLab instance SSH URL."""
-    mock_run = MagicMock()
-    mock_run.stdout = "git@gitlab.devops.telekom.de:org/subgroup/project.git\n"
-    mock_run.returncode = 0
+    remote_url = "git@gitlab.devops.telekom.de:org/subgroup/project.git"
 
-    with patch("subprocess.run", return_value=mock_run):
+    with patch(
+        "contiamo_release_please.gitlab.get_remote_url", return_value=remote_url
+    ):
         host, project_path = get_gitlab_repo_info(Path("/test"))
 
     assert host == "gitlab.devops.telekom.de"
@@ -101,11 +102,11 @@ def test_get_gitlab_repo_info_ssh_custom_instance():
 
 def test_get_gitlab_repo_info_invalid_url():
     """Test error with non-GitLab URL."""
-    mock_run = MagicMock()
-    mock_run.stdout = "https://github.com/owner/repo.git\n"
-    mock_run.returncode = 0
+    remote_url = "https://github.com/owner/repo.git"
 
-    with patch("subprocess.run", return_value=mock_run):
+    with patch(
+        "contiamo_release_please.gitlab.get_remote_url", return_value=remote_url
+    ):
         with pytest.raises(GitLabError, match="Could not parse GitLab host/project"):
             get_gitlab_repo_info(Path("/test"))
 
@@ -125,7 +126,7 @@ def test_find_existing_pr_found():
     mock_response.json.return_value = [{"iid": 42, "title": "Test MR"}]
     mock_response.raise_for_status = MagicMock()
 
-    with patch("requests.get", return_value=mock_response):
+    with patch("requests.Session.get", return_value=mock_response):
         mr_iid = find_existing_pr(
             "gitlab.com",
             "owner/repo",
@@ -143,7 +144,7 @@ def test_find_existing_pr_not_found():
     mock_response.json.return_value = []
     mock_response.raise_for_status = MagicMock()
 
-    with patch("requests.get", return_value=mock_response):
+    with patch("requests.Session.get", return_value=mock_response):
         mr_iid = find_existing_pr(
             "gitlab.com",
             "owner/repo",
@@ -162,7 +163,7 @@ def test_find_existing_pr_api_error():
         "API Error"
     )
 
-    with patch("requests.get", return_value=mock_response):
+    with patch("requests.Session.get", return_value=mock_response):
         with pytest.raises(GitLabError, match="Failed to check for existing MR"):
             find_existing_pr(
                 "gitlab.com",
@@ -183,7 +184,7 @@ def test_create_pull_request():
     }
     mock_response.raise_for_status = MagicMock()
 
-    with patch("requests.post", return_value=mock_response) as mock_post:
+    with patch("requests.Session.post", return_value=mock_response) as mock_post:
         result = create_pull_request(
             "gitlab.com",
             "owner/repo",
@@ -212,7 +213,7 @@ def test_create_pull_request_api_error():
     )
     mock_response.json.return_value = {"message": "Validation failed"}
 
-    with patch("requests.post", return_value=mock_response):
+    with patch("requests.Session.post", return_value=mock_response):
         with pytest.raises(GitLabError, match="Failed to create merge request"):
             create_pull_request(
                 "gitlab.com",
@@ -225,6 +226,36 @@ def test_create_pull_request_api_error():
             )
 
 
+def test_create_pull_request_conflict():
+    """Test a 409 on MR creation reports the existing MR."""
+    error_response = MagicMock(
+        status_code=409, headers={"Content-Type": "application/json"}
+    )
+    error_response.json.return_value = {
+        "message": [
+            "Another open merge request already exists for this source branch: !42"
+        ]
+    }
+    mock_response = MagicMock()
+    mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+        "409 Conflict", response=error_response
+    )
+
+    with patch("requests.Session.post", return_value=mock_response):
+        with pytest.raises(MergeRequestExistsError) as exc_info:
+            create_pull_request(
+                "gitlab.com",
+                "owner/repo",
+                "Test MR",
+                "Test description",
+                "source-branch",
+                "target-branch",
+                "test-token",
+            )
+
+    assert exc_info.value.mr_iid == 42
+
+
 def test_update_pull_request():
     """Test updating an existing MR."""
     mock_response = MagicMock()
@@ -235,7 +266,7 @@ def test_update_pull_request():
     }
     mock_response.raise_for_status = MagicMock()
 
-    with patch("requests.put", return_value=mock_response) as mock_put:
+    with patch("requests.Session.put", return_value=mock_response) as mock_put:
         result = update_pull_request(
             "gitlab.com",
             "owner/repo",
@@ -264,7 +295,7 @@ def test_update_pull_request_api_error():
         "API Error"
     )
 
-    with patch("requests.put", return_value=mock_response):
+    with patch("requests.Session.put", return_value=mock_response):
         with pytest.raises(GitLabError, match="Failed to update merge request"):
             update_pull_request(
                 "gitlab.com",
@@ -286,7 +317,7 @@ def test_create_gitlab_release():
     }
     mock_response.raise_for_status = MagicMock()
 
-    with patch("requests.post", return_value=mock_response) as mock_post:
+    with patch("requests.Session.post", return_value=mock_response) as mock_post:
         result = create_gitlab_release(
             "gitlab.com",
             "owner/repo",
@@ -331,7 +362,7 @@ def test_create_gitlab_release_api_error():
         "API Error"
     )
 
-    with patch("requests.post", return_value=mock_response):
+    with patch("requests.Session.post", return_value=mock_response):
         with pytest.raises(GitLabError, match="Failed to create GitLab release"):
             create_gitlab_release(
                 "gitlab.com",
@@ -368,17 +399,19 @@ def test_create_or_update_pr_creates_new():
 
     assert result is not None
     assert result["iid"] == 42
-    mock_find.assert_called_once()
+    mock_find.assert_not_called()
     mock_create.assert_called_once()
 
 
-def test_create_or_update_pr_updates_existing():
-    """Test create_or_update_pr updates existing MR."""
-    mock_find = MagicMock(return_value=42)
+def test_create_or_update_pr_updates_existing(capsys):
+    """Test create_or_update_pr updates the MR named in the conflict response."""
+    mock_find = MagicMock()
+    mock_create = MagicMock(side_effect=MergeRequestExistsError("exists", 42))
     mock_update = MagicMock(return_value={"iid": 42, "title": "Updated MR"})
 
     with (
         patch("contiamo_release_please.gitlab.find_existing_pr", mock_find),
+        patch("contiamo_release_please.gitlab.create_pull_request", mock_create),
         patch("contiamo_release_please.gitlab.update_pull_request", mock_update),
     ):
         result = create_or_update_pr(
@@ -390,13 +423,41 @@ def test_create_or_update_pr_updates_existing():
             "target-branch",
             "test-token",
             dry_run=False,
-            verbose=False,
+            verbose=True,
         )
 
     assert result is not None
     assert result["iid"] == 42
-    mock_find.assert_called_once()
+    mock_find.assert_not_called()
     mock_update.assert_called_once()
+    assert mock_update.call_args.args[2] == 42
+    assert capsys.readouterr().out == "Updating existing MR !42\n"
+
+
+def test_create_or_update_pr_looks_up_unnamed_conflict():
+    """Test create_or_update_pr finds the MR when the conflict doesn't name it."""
+    mock_find = MagicMock(return_value=7)
+    mock_create = MagicMock(side_effect=MergeRequestExistsError("exists"))
+    mock_update = MagicMock(return_value={"iid": 7, "title": "Updated MR"})
+
+    with (
+        patch("contiamo_release_please.gitlab.find_existing_pr", mock_find),
+        patch("contiamo_release_please.gitlab.create_pull_request", mock_create),
+        patch("contiamo_release_please.gitlab.update_pull_request", mock_update),
+    ):
+        result = create_or_update_pr(
+            "gitlab.com",
+            "owner/repo",
+            "Updated MR",
+            "Updated description",
+            "source-branch",
+            "target-branch",
+            "test-token",
+        )
+
+    assert result["iid"] == 7
+    mock_find.assert_called_once()
+    assert mock_update.call_args.args[2] == 7
 
 
 def test_create_or_update_pr_dry_run():
@@ -414,3 +475,18 @@ def test_create_or_update_pr_dry_run():
     )
 
     assert result is None
+
+
+def test_session_retries_post_only_when_rate_limited():
+    """Test that POSTs are retried on 429 but not on gateway errors."""
+    from contiamo_release_please.gitlab import _get_session
+
+    retry = _get_session().get_adapter("https://gitlab.com").max_retries
+
+    assert retry.is_retry("POST", 429)
+    assert not retry.is_retry("POST", 502)
+    assert not retry.is_retry("POST", 504)
+    assert retry.is_retry("GET", 502)
+    assert retry.is_retry("PUT", 503)
+    # The policy must survive urllib3 copying it between attempts
+    assert retry.increment("POST", "/", error=None).is_retry("POST", 429)
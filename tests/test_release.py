@@ -217,6 +217,7 @@ def test_create_release_branch_workflow_dry_run():
         mock_config_obj.get_version_prefix.return_value = "v"
         mock_config_obj.get_changelog_path.return_value = "CHANGELOG.md"
         mock_config_obj.get_changelog_sections.return_value = []
+        mock_config_obj.ordered_section_names = ()
         mock_config_obj.get_extra_files.return_value = []
         mock_config_obj.get_git_user_name.return_value = "Test User"
         mock_config_obj.get_git_user_email.return_value = "test@example.com"
@@ -388,6 +389,7 @@ def test_create_release_branch_workflow_switches_back_to_source():
         mock_config_obj.get_changelog_path.return_value = "CHANGELOG.md"
         mock_config_obj.get_extra_files.return_value = []
         mock_config_obj.get_changelog_sections.return_value = []
+        mock_config_obj.ordered_section_names = ()
         mock_config_obj.get_git_user_name.return_value = "Test User"
         mock_config_obj.get_git_user_email.return_value = "test@example.com"
         mock_config_obj._config = {}